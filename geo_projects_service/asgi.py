@@ -9,8 +9,21 @@ https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 
 import os
 
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
 from django.core.asgi import get_asgi_application
 
+from projects.asgi import DisconnectMiddleware
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "geo_projects_service.settings")
 
-application = get_asgi_application()
+# Unlike runserver, uvicorn does not serve static files. Without this the
+# admin loses its CSS and JavaScript and /api/docs/ cannot load ReDoc.
+# Django 4.2 does not notice clients that disconnect from a streaming
+# response; the middleware ends their event streams as soon as they go away.
+application = DisconnectMiddleware(ASGIStaticFilesHandler(get_asgi_application()))
+
+# Load the URLconf, views and schema in the background; /api/ready/ reports
+# ready once this has finished.
+from projects.health import start_warm_up  # noqa: E402  pylint: disable=wrong-import-position
+
+start_warm_up()
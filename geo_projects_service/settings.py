@@ -121,6 +121,11 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# Precomputed OpenAPI schema, written by `manage.py build_openapi_schema`
+PROJECTS_SCHEMA_PATH = config('SCHEMA_PATH', default=str(BASE_DIR / 'build' / 'openapi.json'))
+# Serve that file instead of generating the schema from the code; on in the image
+PROJECTS_SCHEMA_FROM_ARTIFACT = config('SCHEMA_FROM_ARTIFACT', default=not DEBUG, cast=bool)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
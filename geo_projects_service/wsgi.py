@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "geo_projects_service.settings")
 
 application = get_wsgi_application()
+
+# Load the URLconf, views and schema in the background; /api/ready/ reports
+# ready once this has finished.
+from projects.health import start_warm_up  # noqa: E402  pylint: disable=wrong-import-position
+
+start_warm_up()
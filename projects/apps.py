@@ -14,7 +14,8 @@ class ProjectsConfig(AppConfig):
     This class configures application-specific settings including:
     - The default auto field type for models
     - The application name
-    - Any application initialization behavior
+    - Any application initialization behavior, such as connecting the
+      receivers that keep derived project data up to date
 
     Attributes:
         default_auto_field (str): Specifies the default primary key field type
@@ -23,3 +24,11 @@ class ProjectsConfig(AppConfig):
     """
     default_auto_field = "django.db.models.BigAutoField"
     name = "projects"
+
+    def ready(self):
+        """
+        Connect the project change signal receivers and register the system
+        checks.
+        """
+        # pylint: disable=import-outside-toplevel,unused-import
+        from . import changes, checks, clusters, signals, summaries, versioning  # noqa: F401
@@ -0,0 +1,72 @@
+"""
+ASGI Disconnect Handling
+
+Django 4.2's ASGI handler stops reading from the connection once the request
+body is complete, so it never sees the ``http.disconnect`` message of a
+client that goes away. A streaming response such as the project event stream
+(see ``projects.events``) then keeps running, and keeps its subscription,
+until its next write fails or its lifetime ends.
+
+``DisconnectMiddleware`` reads the connection after the body instead and
+cancels the request when the client disconnects, as Django 5.0 does itself.
+"""
+import asyncio
+import contextlib
+
+
+class DisconnectMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    ASGI middleware that cancels HTTP requests whose client has disconnected.
+
+    Attributes:
+        application: The wrapped ASGI application
+    """
+
+    def __init__(self, application):
+        """
+        Wrap an ASGI application.
+
+        Args:
+            application: The ASGI application to cancel on disconnect
+        """
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        """
+        Run the application, cancelling it if the client disconnects.
+        """
+        if scope["type"] != "http":
+            await self.application(scope, receive, send)
+            return
+
+        body_read = asyncio.Event()
+        disconnected = asyncio.Event()
+
+        async def receive_request():
+            if body_read.is_set():
+                # Django 5.0+ listens for the disconnect itself.
+                await disconnected.wait()
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.disconnect" or not message.get("more_body", False):
+                body_read.set()
+            return message
+
+        async def watch():
+            await body_read.wait()
+            while (await receive())["type"] != "http.disconnect":
+                pass
+            disconnected.set()
+            request.cancel()
+
+        request = asyncio.ensure_future(self.application(scope, receive_request, send))
+        watcher = asyncio.ensure_future(watch())
+        try:
+            await request
+        except asyncio.CancelledError:
+            if not disconnected.is_set():
+                raise
+        finally:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
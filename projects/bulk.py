@@ -0,0 +1,73 @@
+"""
+Set-Based Project Writes
+
+This module updates and deletes many projects with a handful of SQL
+statements instead of one ``save()`` or ``delete()`` per row, while still
+announcing every affected row through ``projects_changed`` so that derived
+data stays consistent.
+"""
+from django.db import transaction
+
+from .models import Project
+from .signals import SNAPSHOT_FIELDS, send_changes
+
+BATCH_SIZE = 500
+
+
+def _snapshot_rows(queryset):
+    """
+    Lock and snapshot the rows selected by a queryset.
+    """
+    return list(queryset.select_for_update().values(*SNAPSHOT_FIELDS).order_by())
+
+
+def _batches(rows):
+    """
+    Yield primary keys of snapshot rows in chunks of ``BATCH_SIZE``.
+    """
+    for start in range(0, len(rows), BATCH_SIZE):
+        yield [row["id"] for row in rows[start:start + BATCH_SIZE]]
+
+
+def update_projects(queryset, **values):
+    """
+    Apply the same field values to every project in a queryset.
+
+    Args:
+        queryset (QuerySet): The projects to update
+        **values: Plain field values to set (not expressions)
+
+    Returns:
+        int: Number of projects updated
+    """
+    with transaction.atomic(using=queryset.db):
+        rows = _snapshot_rows(queryset)
+        updated = 0
+        for pks in _batches(rows):
+            updated += Project.objects.using(queryset.db).filter(pk__in=pks).update(**values)
+        tracked = {field: value for field, value in values.items() if field in SNAPSHOT_FIELDS}
+        send_changes([(row, {**row, **tracked}) for row in rows])
+    return updated
+
+
+def delete_projects(queryset):
+    """
+    Delete every project in a queryset.
+
+    Args:
+        queryset (QuerySet): The projects to delete
+
+    Returns:
+        int: Number of projects deleted
+    """
+    with transaction.atomic(using=queryset.db):
+        rows = _snapshot_rows(queryset)
+        deleted = 0
+        for pks in _batches(rows):
+            # Project has no reverse relations (enforced by the projects.E001
+            # system check), so the collector, which would load every row and
+            # send post_delete per object, can be skipped.
+            batch = Project.objects.using(queryset.db).filter(pk__in=pks)
+            deleted += batch._raw_delete(using=queryset.db)  # pylint: disable=protected-access
+        send_changes([(row, None) for row in rows])
+    return deleted
@@ -0,0 +1,255 @@
+"""
+Project Change Feed
+
+This module records every project write announced through
+``projects_changed`` in the append-only ``ProjectChange`` log and reads it back
+as an incremental feed for client synchronisation.
+
+Clients hold an opaque cursor naming the last change they have seen. Reading
+the feed costs a primary key range scan over the changes after the cursor, no
+matter how many projects exist. Entries older than
+``PROJECTS_CHANGE_RETENTION_DAYS`` (default 30) are removed by
+``prune_changes``; a cursor that points into the pruned part of the log has
+expired and the client must resynchronise from the full project list.
+
+Clients treat ``geocoded`` entries like ``updated`` ones; they mark updates
+that resolved new coordinates.
+
+Sequence numbers are allocated when a change is written, but the change only
+becomes visible when its transaction commits. On PostgreSQL transactions can
+commit out of sequence order, so a gap in the log may be a change that is
+still being committed. Readers stop at such a gap until the entry after it is
+``PROJECTS_CHANGE_SETTLE_SECONDS`` (default 5) old, after which the gap can
+only be a rolled-back change. This assumes that transactions writing projects
+take less time than that. On SQLite, where writes are serialised, the log has
+no such gaps.
+"""
+import base64
+import binascii
+import datetime
+
+from django.conf import settings
+from django.db.models import Max, Min
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import ProjectChange
+from .signals import projects_changed
+
+CURSOR_PREFIX = "1:"
+DEFAULT_RETENTION_DAYS = 30
+DEFAULT_SETTLE_SECONDS = 5
+
+
+class CursorExpired(Exception):
+    """
+    Raised when a cursor points to changes that have already been pruned.
+    """
+
+
+def encode_cursor(seq):
+    """
+    Encode a change sequence number as an opaque cursor.
+
+    Args:
+        seq (int): The last change sequence number seen by the client
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{CURSOR_PREFIX}{seq}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode an opaque cursor back into a change sequence number.
+
+    Args:
+        cursor (str): A cursor produced by ``encode_cursor``
+
+    Returns:
+        int: The change sequence number
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        text = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Malformed cursor.") from e
+    if not text.startswith(CURSOR_PREFIX) or not text[len(CURSOR_PREFIX):].isdigit():
+        raise ValueError("Malformed cursor.")
+    return int(text[len(CURSOR_PREFIX):])
+
+
+def _coordinates(row):
+    """
+    Return the coordinates of a snapshot as floats, or None if incomplete.
+    """
+    if row["latitude"] is None or row["longitude"] is None:
+        return None
+    return float(row["latitude"]), float(row["longitude"])
+
+
+def operation_for(before, after):
+    """
+    Classify a ``(before, after)`` snapshot pair as a change log operation.
+
+    Updates that set new, non-empty coordinates are reported as ``geocoded``.
+
+    Returns:
+        str: ``created``, ``updated``, ``geocoded`` or ``deleted``
+    """
+    if before is None:
+        return "created"
+    if after is None:
+        return "deleted"
+    coordinates = _coordinates(after)
+    if coordinates is not None and coordinates != _coordinates(before):
+        return "geocoded"
+    return "updated"
+
+
+# pylint: disable=unused-argument
+@receiver(projects_changed)
+def record_changes(sender, changes, **kwargs):
+    """
+    Append one log entry per changed project.
+    """
+    ProjectChange.objects.bulk_create(
+        (
+            ProjectChange(
+                project_uuid=(after or before)["uuid"], operation=operation_for(before, after)
+            )
+            for before, after in changes
+        ),
+        batch_size=500,
+    )
+
+
+def head_seq():
+    """
+    Return the sequence number of the newest change, 0 if there are none.
+    """
+    return ProjectChange.objects.aggregate(head=Max("seq"))["head"] or 0
+
+
+def settle_delay():
+    """
+    Return how long a gap in the log may be a change still being committed.
+    """
+    return datetime.timedelta(
+        seconds=getattr(settings, "PROJECTS_CHANGE_SETTLE_SECONDS", DEFAULT_SETTLE_SECONDS)
+    )
+
+
+def settled(entries, after_seq, now=None):
+    """
+    Return the leading log entries that no uncommitted change can precede.
+
+    Args:
+        entries (list[ProjectChange]): Entries after ``after_seq``, in sequence order
+        after_seq (int): Sequence number the entries follow
+        now (datetime | None): Reference time, the current time by default
+
+    Returns:
+        list[ProjectChange]: The entries up to the first recent gap
+    """
+    cutoff = (now or timezone.now()) - settle_delay()
+    expected = after_seq + 1
+    for index, entry in enumerate(entries):
+        if entry.seq != expected and entry.changed_at > cutoff:
+            return entries[:index]
+        expected = entry.seq + 1
+    return entries
+
+
+def settled_head_seq(now=None):
+    """
+    Return the newest sequence number that no uncommitted change precedes.
+
+    New readers start from here rather than from ``head_seq``, so that they
+    do not skip changes that are still being committed.
+    """
+    now = now or timezone.now()
+    older = (
+        ProjectChange.objects.filter(changed_at__lte=now - settle_delay())
+        .order_by("-seq").values_list("seq", flat=True).first()
+    ) or 0
+    recent = list(ProjectChange.objects.filter(seq__gt=older).order_by("seq").only("changed_at"))
+    recent = settled(recent, older, now)
+    return recent[-1].seq if recent else older
+
+
+def cursor_expired(after_seq):
+    """
+    Return whether changes after a sequence number may have been pruned.
+
+    Args:
+        after_seq (int): Sequence number of the last change the client has seen
+
+    Returns:
+        bool: True if the client must resynchronise from the full project list
+    """
+    oldest = ProjectChange.objects.aggregate(oldest=Min("seq"))["oldest"]
+    return oldest is not None and after_seq < oldest - 1
+
+
+def read_changes(after_seq, limit):
+    """
+    Return up to ``limit`` changes that happened after a sequence number.
+
+    Several changes to the same project within the page are collapsed into
+    the latest one. Reading stops early at a gap that may still be filled
+    (see ``settled``).
+
+    Args:
+        after_seq (int): Sequence number of the last change the client has seen
+        limit (int): Maximum number of log entries to read
+
+    Returns:
+        tuple[list[ProjectChange], int, bool]: The collapsed changes in sequence
+            order, the sequence number to resume from, and whether more
+            changes are waiting
+
+    Raises:
+        CursorExpired: If changes after ``after_seq`` have been pruned
+    """
+    if cursor_expired(after_seq):
+        raise CursorExpired()
+
+    entries = list(ProjectChange.objects.filter(seq__gt=after_seq).order_by("seq")[:limit + 1])
+    has_more = len(entries) > limit
+    entries = settled(entries[:limit], after_seq)
+    has_more = has_more and len(entries) == limit
+    latest = {entry.project_uuid: entry for entry in entries}
+    collapsed = sorted(latest.values(), key=lambda entry: entry.seq)
+    next_seq = entries[-1].seq if entries else after_seq
+    return collapsed, next_seq, has_more
+
+
+def retention_days():
+    """
+    Return how many days change log entries and tombstones are kept.
+    """
+    return getattr(settings, "PROJECTS_CHANGE_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+
+
+def prune_changes(now=None):
+    """
+    Delete change log entries older than the retention window.
+
+    The newest entry is always kept so that the log remembers how far it has
+    advanced and older cursors can be recognised as expired.
+
+    Args:
+        now (datetime | None): Reference time, the current time by default
+
+    Returns:
+        int: Number of entries deleted
+    """
+    cutoff = (now or timezone.now()) - datetime.timedelta(days=retention_days())
+    deleted, _ = (
+        ProjectChange.objects.filter(changed_at__lt=cutoff, seq__lt=head_seq()).delete()
+    )
+    return deleted
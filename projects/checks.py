@@ -0,0 +1,31 @@
+"""
+System Checks for the Projects App
+
+``projects.bulk.delete_projects`` deletes rows with ``QuerySet._raw_delete``,
+which skips Django's deletion collector: it neither cascades nor clears
+relations pointing at the deleted projects. That is only safe while no model
+has a relation to ``Project``; this check fails as soon as one is added.
+"""
+from django.core import checks
+
+from .models import Project
+
+
+@checks.register(checks.Tags.models)
+def check_project_has_no_reverse_relations(app_configs, **kwargs):  # pylint: disable=unused-argument
+    """
+    Report relations to Project, which raw bulk deletes would not handle.
+
+    Returns:
+        list[checks.Error]: One error per relation
+    """
+    return [
+        checks.Error(
+            f"{relation.related_model._meta.label}.{relation.field.name} relates to "
+            "Project, but projects.bulk.delete_projects skips the deletion collector.",
+            hint="Delete related rows in delete_projects, or switch it to QuerySet.delete().",
+            obj=Project,
+            id="projects.E001",
+        )
+        for relation in Project._meta.related_objects  # pylint: disable=protected-access
+    ]
@@ -0,0 +1,272 @@
+"""
+Server-Side Map Clustering
+
+This module maintains a hierarchical grid of project clusters, one level per
+map zoom, in the ``ProjectCluster`` table. The grid follows Web Mercator
+tiles: at zoom ``z`` each tile is split into ``2 ** CELL_BITS`` cells per
+axis, so a map tile always covers the same number of cells regardless of
+zoom. Each cell stores a project count and coordinate sums, which is enough
+to serve cluster centroids for any viewport without reading the Project table.
+
+Cells are adjusted incrementally on every write announced through
+``projects_changed``; ``rebuild_clusters`` recomputes them from scratch.
+"""
+import math
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.dispatch import receiver
+
+from .models import Project, ProjectCluster
+from .signals import projects_changed
+
+MAX_ZOOM = 16
+CELL_BITS = 3
+MAX_LATITUDE = 85.05112878
+SMALL_CLUSTER_SIZE = 5
+MAX_CELLS_PER_QUERY = 10_000
+REPRESENTATIVE_BATCH_SIZE = 100
+COORDINATE_EPSILON = 1e-6
+
+
+def cells_per_axis(zoom):
+    """
+    Return the number of grid cells along each axis at a zoom level.
+    """
+    return 1 << (zoom + CELL_BITS)
+
+
+def cell_for(latitude, longitude, zoom):
+    """
+    Return the grid cell containing a coordinate at a zoom level.
+
+    Args:
+        latitude (Decimal | float): Latitude in degrees
+        longitude (Decimal | float): Longitude in degrees
+        zoom (int): Zoom level
+
+    Returns:
+        tuple[int, int]: The ``(cell_x, cell_y)`` of the cell
+    """
+    size = cells_per_axis(zoom)
+    lat = math.radians(max(-MAX_LATITUDE, min(MAX_LATITUDE, float(latitude))))
+    x = (float(longitude) + 180.0) / 360.0 * size
+    y = (1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * size
+    return min(max(int(x), 0), size - 1), min(max(int(y), 0), size - 1)
+
+
+def cell_bounds(zoom, cell_x, cell_y):
+    """
+    Return the geographic bounds of a grid cell.
+
+    Returns:
+        tuple[float, float, float, float]: ``(west, south, east, north)``
+    """
+    size = cells_per_axis(zoom)
+
+    def latitude(row):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / size))))
+
+    west = cell_x / size * 360.0 - 180.0
+    east = (cell_x + 1) / size * 360.0 - 180.0
+    return west, latitude(cell_y + 1), east, latitude(cell_y)
+
+
+def cell_ranges(bbox, zoom):
+    """
+    Return the ranges of grid cells that intersect a bounding box.
+
+    A box whose west edge lies east of its east edge crosses the antimeridian
+    and yields two column ranges.
+
+    Args:
+        bbox (tuple[float, float, float, float]): ``(west, south, east, north)``
+        zoom (int): Zoom level
+
+    Returns:
+        list[tuple[int, int, int, int]]: ``(x_min, x_max, y_min, y_max)`` ranges
+
+    Raises:
+        ValueError: If the box covers more than ``MAX_CELLS_PER_QUERY`` cells
+    """
+    west, south, east, north = bbox
+    x_west, y_north = cell_for(north, west, zoom)
+    x_east, y_south = cell_for(south, east, zoom)
+    if west <= east:
+        columns = [(x_west, x_east)]
+    else:
+        columns = [(x_west, cells_per_axis(zoom) - 1), (0, x_east)]
+
+    ranges = [(x_min, x_max, y_north, y_south) for x_min, x_max in columns]
+    cells = sum((x_max - x_min + 1) * (y_south - y_north + 1) for x_min, x_max, *_ in ranges)
+    if cells > MAX_CELLS_PER_QUERY:
+        raise ValueError("Bounding box is too large for this zoom level.")
+    return ranges
+
+
+def cluster_deltas(changes):
+    """
+    Translate project changes into per-cell count and coordinate deltas.
+
+    Args:
+        changes (list[tuple[dict | None, dict | None]]): ``(before, after)`` pairs
+
+    Returns:
+        dict: ``(zoom, cell_x, cell_y)`` to ``[count, latitude_sum, longitude_sum]``
+    """
+    deltas = defaultdict(lambda: [0, 0.0, 0.0])
+    for before, after in changes:
+        for row, sign in ((before, -1), (after, 1)):
+            if row is None or row["latitude"] is None or row["longitude"] is None:
+                continue
+            lat, lng = float(row["latitude"]), float(row["longitude"])
+            for zoom in range(MAX_ZOOM + 1):
+                delta = deltas[(zoom, *cell_for(lat, lng, zoom))]
+                delta[0] += sign
+                delta[1] += sign * lat
+                delta[2] += sign * lng
+    return deltas
+
+
+def apply_cluster_deltas(deltas):
+    """
+    Add cell deltas to the cluster table, creating missing cells.
+
+    Args:
+        deltas (dict): Output of ``cluster_deltas``
+    """
+    for (zoom, x, y), (count, lat_sum, lng_sum) in sorted(deltas.items()):
+        if not count and not lat_sum and not lng_sum:
+            continue
+        cell = ProjectCluster.objects.filter(zoom=zoom, cell_x=x, cell_y=y)
+        changes = {
+            "count": F("count") + count,
+            "latitude_sum": F("latitude_sum") + lat_sum,
+            "longitude_sum": F("longitude_sum") + lng_sum,
+        }
+        if cell.update(**changes):
+            continue
+        try:
+            with transaction.atomic():
+                ProjectCluster.objects.create(
+                    zoom=zoom, cell_x=x, cell_y=y,
+                    count=count, latitude_sum=lat_sum, longitude_sum=lng_sum,
+                )
+        except IntegrityError:
+            cell.update(**changes)
+
+
+# pylint: disable=unused-argument
+@receiver(projects_changed)
+def update_clusters(sender, changes, **kwargs):
+    """
+    Keep the cluster grid in step with project changes.
+    """
+    apply_cluster_deltas(cluster_deltas(changes))
+
+
+def rebuild_clusters():
+    """
+    Recompute the whole cluster grid from project coordinates.
+
+    The existing cells are locked before the projects are read, as in
+    ``projects.summaries.reconcile_statistics``, so that deltas of concurrent
+    writes wait for the rebuild instead of being applied to cells it is about
+    to replace.
+
+    Returns:
+        int: Number of cells written
+    """
+    with transaction.atomic():
+        list(ProjectCluster.objects.select_for_update().values_list("pk", flat=True))
+        cells = defaultdict(lambda: [0, 0.0, 0.0])
+        coordinates = (
+            Project.objects
+            .filter(latitude__isnull=False, longitude__isnull=False)
+            .values_list("latitude", "longitude")
+            .iterator(chunk_size=2000)
+        )
+        for latitude, longitude in coordinates:
+            lat, lng = float(latitude), float(longitude)
+            for zoom in range(MAX_ZOOM + 1):
+                cell = cells[(zoom, *cell_for(lat, lng, zoom))]
+                cell[0] += 1
+                cell[1] += lat
+                cell[2] += lng
+
+        ProjectCluster.objects.all().delete()
+        ProjectCluster.objects.bulk_create(
+            (
+                ProjectCluster(
+                    zoom=zoom, cell_x=x, cell_y=y,
+                    count=count, latitude_sum=lat_sum, longitude_sum=lng_sum,
+                )
+                for (zoom, x, y), (count, lat_sum, lng_sum) in cells.items()
+            ),
+            batch_size=1000,
+        )
+    return len(cells)
+
+
+def _attach_representatives(clusters, zoom):
+    """
+    Add the project UUIDs of small clusters, a batch of cells per query.
+    """
+    small = sorted(cell for cell, cluster in clusters.items()
+                   if cluster["count"] <= SMALL_CLUSTER_SIZE)
+    for start in range(0, len(small), REPRESENTATIVE_BATCH_SIZE):
+        batch = set(small[start:start + REPRESENTATIVE_BATCH_SIZE])
+        area = Q()
+        for cell in batch:
+            west, south, east, north = cell_bounds(zoom, *cell)
+            area |= Q(
+                latitude__range=(south - COORDINATE_EPSILON, north + COORDINATE_EPSILON),
+                longitude__range=(west - COORDINATE_EPSILON, east + COORDINATE_EPSILON),
+            )
+        rows = (
+            Project.objects.filter(area)
+            .values_list("uuid", "latitude", "longitude").order_by("pk")
+        )
+        for project_uuid, latitude, longitude in rows:
+            cell = cell_for(latitude, longitude, zoom)
+            if cell in batch:
+                clusters[cell].setdefault("project_uuids", []).append(str(project_uuid))
+
+
+def find_clusters(bbox, zoom):
+    """
+    Return the project clusters visible in a bounding box at a zoom level.
+
+    Args:
+        bbox (tuple[float, float, float, float]): ``(west, south, east, north)``
+        zoom (int): Zoom level; values above ``MAX_ZOOM`` use ``MAX_ZOOM``
+
+    Returns:
+        list[dict]: Clusters with centroid ``latitude``/``longitude``, ``count``
+                    and, for clusters of at most ``SMALL_CLUSTER_SIZE``
+                    projects, their ``project_uuids``
+
+    Raises:
+        ValueError: If the box covers too many cells at this zoom level
+    """
+    zoom = min(zoom, MAX_ZOOM)
+    area = Q()
+    for x_min, x_max, y_min, y_max in cell_ranges(bbox, zoom):
+        area |= Q(cell_x__range=(x_min, x_max), cell_y__range=(y_min, y_max))
+
+    rows = (
+        ProjectCluster.objects.filter(area, zoom=zoom, count__gt=0)
+        .values_list("cell_x", "cell_y", "count", "latitude_sum", "longitude_sum")
+        .order_by("cell_y", "cell_x")
+    )
+    clusters = {
+        (x, y): {
+            "latitude": round(lat_sum / count, 6),
+            "longitude": round(lng_sum / count, 6),
+            "count": count,
+        }
+        for x, y, count, lat_sum, lng_sum in rows
+    }
+    _attach_representatives(clusters, zoom)
+    return list(clusters.values())
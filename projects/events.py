@@ -0,0 +1,331 @@
+"""
+Project Event Stream
+
+This module pushes project changes to Server-Sent Events (SSE) clients. It is
+built on the ``ProjectChange`` log (see ``projects.changes``):
+
+- One ``ChangeBroadcaster`` per process polls the log from a single asyncio
+  task and fans each new change out to the in-memory queues of all connected
+  clients. Idle clients cost one queue each; there is no thread per client
+  and no external broker.
+- Each event is rendered once and shared by every client that receives it.
+- Clients resume with ``Last-Event-ID``: changes after that id are replayed
+  from the log before live events continue, without gaps or duplicates.
+
+Streams close after ``PROJECTS_EVENTS_STREAM_LIFETIME`` seconds (default 300)
+or when a client falls too far behind; EventSource clients then reconnect and
+resume from their last event id. Streams of clients that disconnect are
+cancelled by ``projects.asgi.DisconnectMiddleware``. Polling happens every
+``PROJECTS_EVENTS_POLL_INTERVAL`` seconds (default 1).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from .changes import cursor_expired, settled, settled_head_seq
+from .models import Project, ProjectChange
+from .serializer import ProjectSerializer
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+QUEUE_SIZE = 1000
+KEEPALIVE_INTERVAL = 15
+RETRY_MILLISECONDS = 3000
+DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_STREAM_LIFETIME = 300
+
+
+class ProjectEvent:  # pylint: disable=too-few-public-methods
+    """
+    A rendered project change, ready to be sent to any number of clients.
+
+    Attributes:
+        seq (int): Change sequence number, used as the SSE event id
+        operation (str): ``created``, ``updated``, ``geocoded`` or ``deleted``
+        status (str | None): Current project status, None for deletions
+        latitude (float | None): Current project latitude
+        longitude (float | None): Current project longitude
+        message (str): The encoded SSE message
+    """
+    __slots__ = ("seq", "operation", "status", "latitude", "longitude", "message")
+
+    def __init__(self, entry, project):
+        """
+        Render a change log entry with the current state of its project.
+
+        Args:
+            entry (ProjectChange): The change log entry
+            project (Project | None): The project, None if it no longer exists
+        """
+        self.seq = entry.seq
+        self.operation = entry.operation
+        self.status = project.status if project else None
+        self.latitude = (
+            float(project.latitude) if project and project.latitude is not None else None
+        )
+        self.longitude = (
+            float(project.longitude) if project and project.longitude is not None else None
+        )
+        data = {
+            "uuid": str(entry.project_uuid),
+            "project": ProjectSerializer(project).data if project else None,
+        }
+        self.message = (
+            f"id: {self.seq}\nevent: {self.operation}\n"
+            f"data: {json.dumps(data, cls=JSONEncoder)}\n\n"
+        )
+
+    def matches(self, statuses=None, bbox=None):
+        """
+        Return whether the event passes a client's filters.
+
+        Deletions always pass, since a deleted project's state is unknown.
+
+        Args:
+            statuses (frozenset[str] | None): Statuses to accept, None for all
+            bbox (tuple | None): ``(west, south, east, north)`` to accept, None for all
+
+        Returns:
+            bool: True if the event should be sent
+        """
+        if self.operation == "deleted":
+            return True
+        if statuses and self.status not in statuses:
+            return False
+        if not bbox:
+            return True
+        west, south, east, north = bbox
+        if self.longitude is None or self.latitude is None or not south <= self.latitude <= north:
+            return False
+        if west <= east:
+            return west <= self.longitude <= east
+        return self.longitude >= west or self.longitude <= east
+
+
+def load_events(after_seq, limit=BATCH_SIZE, until=None):
+    """
+    Read and render changes after a sequence number.
+
+    Reading stops early at a gap that may still be filled (see
+    ``projects.changes.settled``).
+
+    Args:
+        after_seq (int): Sequence number to read after
+        limit (int): Maximum number of changes to read
+        until (int | None): Highest sequence number to include
+
+    Returns:
+        list[ProjectEvent]: Events in sequence order
+    """
+    entries = ProjectChange.objects.filter(seq__gt=after_seq).order_by("seq")
+    if until is not None:
+        entries = entries.filter(seq__lte=until)
+    entries = settled(list(entries[:limit]), after_seq)
+    live = {entry.project_uuid for entry in entries if entry.operation != "deleted"}
+    projects = {project.uuid: project for project in Project.objects.filter(uuid__in=live)}
+    return [ProjectEvent(entry, projects.get(entry.project_uuid)) for entry in entries]
+
+
+class Subscription:
+    """
+    One client's view of the broadcast: a bounded queue of events.
+
+    Attributes:
+        queue (asyncio.Queue): Events waiting to be sent to the client
+        start (int | None): Events after this sequence number are delivered
+        started (asyncio.Event): Set once ``start`` is known, or the
+                                 subscription was cancelled
+        overflowed (bool): Whether events were dropped because the client lagged
+    """
+
+    def __init__(self):
+        """
+        Create an empty subscription whose start is not yet known.
+        """
+        self.queue = asyncio.Queue(QUEUE_SIZE)
+        self.start = None
+        self.started = asyncio.Event()
+        self.overflowed = False
+
+    def begin(self, position):
+        """
+        Record the sequence number after which events will be delivered.
+        """
+        self.start = position
+        self.started.set()
+
+    def cancel(self):
+        """
+        Release a subscription that cannot start; its stream ends.
+        """
+        self.started.set()
+
+    def deliver(self, event):
+        """
+        Queue an event, or mark the subscription as overflowed if it is full.
+        """
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class ChangeBroadcaster:
+    """
+    Polls the change log from one task and fans events out to subscriptions.
+
+    The polling task runs only while there are subscribers. Subscribing,
+    delivering and advancing the position never await in between, so every
+    subscription receives exactly the events after its ``start``.
+    """
+
+    def __init__(self):
+        """
+        Create an idle broadcaster.
+        """
+        self._subscriptions = set()
+        self._task = None
+        self._loop = None
+        self._position = None
+
+    def subscribe(self):
+        """
+        Register a new subscription, starting the polling task if needed.
+
+        Returns:
+            Subscription: The new subscription
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._subscriptions = set()
+            self._loop = loop
+            self._task = None
+        if self._task is None or self._task.done():
+            self._position = None
+            self._task = loop.create_task(self._run())
+        subscription = Subscription()
+        self._subscriptions.add(subscription)
+        if self._position is not None:
+            subscription.begin(self._position)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Remove a subscription; the polling task stops after the last one.
+        """
+        self._subscriptions.discard(subscription)
+
+    async def _run(self):
+        """
+        Poll the change log and deliver new events while anyone listens.
+        """
+        try:
+            self._position = await sync_to_async(settled_head_seq)()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.exception("Reading the project change log head failed")
+            for subscription in self._subscriptions:
+                subscription.cancel()
+            return
+        for subscription in self._subscriptions:
+            if subscription.start is None:
+                subscription.begin(self._position)
+
+        interval = getattr(settings, "PROJECTS_EVENTS_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)
+        while self._subscriptions:
+            await asyncio.sleep(interval)
+            try:
+                events = await sync_to_async(load_events)(self._position)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Polling project changes failed")
+                continue
+            for event in events:
+                for subscription in self._subscriptions:
+                    subscription.deliver(event)
+                self._position = event.seq
+        self._position = None
+
+
+broadcaster = ChangeBroadcaster()
+
+
+async def _wait_started(subscription, timeout):
+    """
+    Wait for a subscription to start; return False if it was cancelled or
+    did not start in time.
+    """
+    try:
+        await asyncio.wait_for(subscription.started.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return False
+    return subscription.start is not None
+
+
+async def _replay(last_sent, until, statuses, bbox):
+    """
+    Generate the messages of the changes a resuming client missed, or a
+    ``resync`` event if they have been pruned.
+    """
+    if await sync_to_async(cursor_expired)(last_sent):
+        yield "event: resync\ndata: {}\n\n"
+        return
+    while last_sent < until:
+        events = await sync_to_async(load_events)(last_sent, until=until)
+        if not events:
+            break
+        for event in events:
+            if event.matches(statuses, bbox):
+                yield event.message
+        last_sent = events[-1].seq
+
+
+async def stream_events(last_event_id=None, statuses=None, bbox=None):
+    """
+    Generate the SSE messages for one client.
+
+    Args:
+        last_event_id (int | None): Resume after this event id
+        statuses (frozenset[str] | None): Only send events for these statuses
+        bbox (tuple | None): Only send events for projects inside this box
+
+    Yields:
+        str: SSE messages, including keepalive comments
+    """
+    loop = asyncio.get_running_loop()
+    lifetime = getattr(settings, "PROJECTS_EVENTS_STREAM_LIFETIME", DEFAULT_STREAM_LIFETIME)
+    deadline = loop.time() + lifetime
+    subscription = broadcaster.subscribe()
+    try:
+        if not await _wait_started(subscription, lifetime):
+            return  # the broadcaster could not start; the client reconnects
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+
+        if last_event_id is not None:
+            async for message in _replay(last_event_id, subscription.start, statuses, bbox):
+                yield message
+
+        while not subscription.overflowed:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=min(KEEPALIVE_INTERVAL, remaining)
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if last_event_id is not None and event.seq <= last_event_id:
+                continue
+            if event.matches(statuses, bbox):
+                yield event.message
+    finally:
+        broadcaster.unsubscribe(subscription)
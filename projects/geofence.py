@@ -0,0 +1,216 @@
+"""
+Polygon Geofence Queries
+
+This module finds the projects inside a GeoJSON ``Polygon`` or
+``MultiPolygon`` region in two steps:
+
+1. An indexed range query on ``(latitude, longitude)`` selects the projects
+   inside the region's bounding box.
+2. A vectorized even-odd ray casting test decides which of those candidates
+   lie inside the region, a batch of candidates at a time.
+
+Regions are prepared once and cached by their coordinates. Preparing splits
+the region's latitude span into bands and lists the edges crossing each band,
+so a point is only tested against the edges of its own band instead of every
+edge of the region. Holes and multiple polygons are handled by the even-odd
+rule. Coordinates are planar ``[longitude, latitude]`` pairs, so regions that
+cross the antimeridian must be split into a ``MultiPolygon`` as RFC 7946
+recommends.
+"""
+import functools
+
+import numpy as np
+
+from .models import Project
+
+MAX_BANDS = 1024
+REGION_CACHE_SIZE = 64
+SCAN_BATCH_SIZE = 5000
+MAX_SCAN = 100_000
+CHUNK_ELEMENTS = 1 << 20
+
+
+def _edges(polygons):
+    """
+    Return the start and end points of every sloped edge of a region.
+
+    Horizontal edges are dropped, since they never cross a horizontal ray.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: ``(n, 2)`` arrays of
+            ``(longitude, latitude)`` edge starts and ends
+    """
+    rings = [np.asarray(ring, dtype=np.float64) for polygon in polygons for ring in polygon]
+    starts = np.concatenate([ring[:-1] for ring in rings])
+    ends = np.concatenate([ring[1:] for ring in rings])
+    sloped = starts[:, 1] != ends[:, 1]
+    return starts[sloped], ends[sloped]
+
+
+def _spread(low, high):
+    """
+    Expand edges spanning bands ``low..high`` into one entry per band.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Edge indexes and their bands,
+            sorted by band
+    """
+    spans = high - low + 1
+    edge_ids = np.repeat(np.arange(len(low)), spans)
+    offsets = np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans)
+    bands = np.repeat(low, spans) + offsets
+    order = np.argsort(bands, kind="stable")
+    return edge_ids[order], bands[order]
+
+
+class PreparedRegion:  # pylint: disable=too-few-public-methods
+    """
+    A polygon region with its edges indexed by latitude band.
+
+    Attributes:
+        bbox (tuple[float, float, float, float]): ``(west, south, east, north)``
+                                                  of all vertices
+    """
+
+    def __init__(self, polygons):
+        """
+        Build the edge arrays and the band index of a region.
+
+        Args:
+            polygons (tuple): Polygons, each a tuple of closed rings, each a
+                              tuple of ``(longitude, latitude)`` pairs
+        """
+        vertices = np.array(
+            [vertex for polygon in polygons for ring in polygon for vertex in ring],
+            dtype=np.float64,
+        )
+        self.bbox = (*map(float, vertices.min(axis=0)), *map(float, vertices.max(axis=0)))
+        starts, ends = _edges(polygons)
+
+        self._bands = int(np.clip(np.sqrt(len(starts)), 1, MAX_BANDS))
+        self._band_height = (self.bbox[3] - self.bbox[1]) / self._bands or 1.0
+        edge_ids, bands = _spread(
+            self._band_of(np.minimum(starts[:, 1], ends[:, 1])),
+            self._band_of(np.maximum(starts[:, 1], ends[:, 1])),
+        )
+        self._band_offsets = np.searchsorted(bands, np.arange(self._bands + 1))
+
+        # Rows: start longitude, start latitude, end latitude, inverse slope;
+        # columns: edges grouped by band.
+        starts, ends = starts[edge_ids], ends[edge_ids]
+        self._edges = np.stack((
+            starts[:, 0], starts[:, 1], ends[:, 1],
+            (ends[:, 0] - starts[:, 0]) / (ends[:, 1] - starts[:, 1]),
+        ))
+
+    def _band_of(self, latitudes):
+        """
+        Return the band index of each latitude, clipped to the region.
+        """
+        bands = ((latitudes - self.bbox[1]) / self._band_height).astype(np.int64)
+        return np.clip(bands, 0, self._bands - 1)
+
+    def contains(self, longitudes, latitudes):
+        """
+        Test which points lie inside the region.
+
+        Args:
+            longitudes (numpy.ndarray): Point longitudes
+            latitudes (numpy.ndarray): Point latitudes
+
+        Returns:
+            numpy.ndarray: Boolean mask, True for points inside the region
+        """
+        west, south, east, north = self.bbox
+        inside = np.zeros(len(longitudes), dtype=bool)
+        (points,) = np.nonzero(
+            (longitudes >= west) & (longitudes <= east)
+            & (latitudes >= south) & (latitudes <= north)
+        )
+        points = points[np.argsort(self._band_of(latitudes[points]), kind="stable")]
+        bands, group_starts = np.unique(self._band_of(latitudes[points]), return_index=True)
+        for band, group in zip(bands, np.split(points, group_starts[1:])):
+            edges = self._edges[:, self._band_offsets[band]:self._band_offsets[band + 1]]
+            if edges.shape[1]:
+                inside[group] = self._crosses_odd(edges, longitudes, latitudes, group)
+        return inside
+
+    @staticmethod
+    def _crosses_odd(edges, longitudes, latitudes, points):
+        """
+        Cast a ray east from each point and test for an odd number of crossings.
+
+        Points are processed in chunks that bound the size of the
+        points-by-edges intermediate arrays.
+        """
+        x0, y0, y1, slope = edges
+        result = np.empty(len(points), dtype=bool)
+        step = max(1, CHUNK_ELEMENTS // len(x0))
+        for offset in range(0, len(points), step):
+            chunk = points[offset:offset + step]
+            px = longitudes[chunk, np.newaxis]
+            py = latitudes[chunk, np.newaxis]
+            crossings = ((y0 > py) != (y1 > py)) & (px < x0 + (py - y0) * slope)
+            result[offset:offset + step] = np.count_nonzero(crossings, axis=1) % 2 == 1
+        return result
+
+
+@functools.lru_cache(maxsize=REGION_CACHE_SIZE)
+def prepare_region(polygons):
+    """
+    Return the prepared form of a region, reusing it for repeated regions.
+
+    Args:
+        polygons (tuple): Polygons as validated by ``GeoJSONPolygonField``
+
+    Returns:
+        PreparedRegion: The prepared region
+    """
+    return PreparedRegion(polygons)
+
+
+def find_within(region, after=0, limit=100):
+    """
+    Return the primary keys of projects inside a region, in key order.
+
+    At most ``MAX_SCAN`` bounding box candidates are tested per call, so a
+    page may hold fewer than ``limit`` projects while more remain.
+
+    Args:
+        region (PreparedRegion): The region to search
+        after (int): Only consider projects with a greater primary key
+        limit (int): Maximum number of projects to return
+
+    Returns:
+        tuple[list[int], int, bool]: The matching primary keys, the primary
+            key to resume after, and whether more candidates remain
+    """
+    west, south, east, north = region.bbox
+    candidates = (
+        Project.objects.filter(
+            latitude__range=(south, north), longitude__range=(west, east)
+        )
+        .order_by("pk")
+        .values_list("pk", "longitude", "latitude")
+    )
+    matches = []
+    position = after
+    for _ in range(MAX_SCAN // SCAN_BATCH_SIZE):
+        rows = list(candidates.filter(pk__gt=position)[:SCAN_BATCH_SIZE])
+        if not rows:
+            return matches, position, False
+        coordinates = np.array([row[1:] for row in rows], dtype=np.float64)
+        hits = region.contains(coordinates[:, 0], coordinates[:, 1])
+        inside = [row[0] for row, hit in zip(rows, hits) if hit]
+
+        needed = limit - len(matches)
+        if len(inside) > needed:
+            matches.extend(inside[:needed])
+            return matches, matches[-1], True
+        matches.extend(inside)
+        position = rows[-1][0]
+        if len(rows) < SCAN_BATCH_SIZE:
+            return matches, position, False
+        if len(matches) == limit:
+            return matches, position, True
+    return matches, position, True
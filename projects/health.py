@@ -0,0 +1,96 @@
+"""
+Warm-up and Readiness
+
+A new process loads the URLconf, views, serializers, NumPy and the OpenAPI
+schema lazily, so without warm-up the first requests it serves would pay for
+all of it. ``start_warm_up`` loads them in a background thread as soon as the
+WSGI or ASGI application is created, and the readiness endpoint reports 503
+until that has finished, so that load balancers only route traffic to warm
+processes.
+"""
+import importlib
+import logging
+import threading
+import time
+
+from django.db import connection
+from django.http import JsonResponse
+from django.urls import get_resolver
+from django.views.decorators.http import require_GET
+from rest_framework import status
+
+from .schema import load_schema
+
+logger = logging.getLogger(__name__)
+
+WARM_MODULES = ("projects.geofence", "projects.route", "projects.google_maps")
+
+_ready = threading.Event()
+_started = threading.Lock()
+
+
+def warm_up():
+    """
+    Load everything the first requests would otherwise load, then mark the
+    process as ready.
+
+    Returns:
+        float: Seconds spent warming up
+    """
+    started = time.perf_counter()
+    get_resolver().url_patterns  # pylint: disable=expression-not-assigned
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+    load_schema()
+    try:
+        connection.ensure_connection()
+    finally:
+        connection.close()
+    _ready.set()
+    elapsed = time.perf_counter() - started
+    logger.info("Warm-up finished in %.3f s", elapsed)
+    return elapsed
+
+
+def _warm_up_in_background():
+    """
+    Run the warm-up, logging rather than raising failures.
+    """
+    try:
+        warm_up()
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Warm-up failed; the process will not report ready")
+
+
+def start_warm_up():
+    """
+    Start warming up in a background thread, once per process.
+    """
+    if _started.acquire(blocking=False):  # pylint: disable=consider-using-with
+        threading.Thread(
+            target=_warm_up_in_background, name="projects-warm-up", daemon=True
+        ).start()
+
+
+def is_ready():
+    """
+    Return whether the process has finished warming up.
+    """
+    return _ready.is_set()
+
+
+@require_GET
+def readiness(request):
+    """
+    Readiness probe (GET /api/ready/).
+
+    Returns:
+        JsonResponse: ``{"ready": true}``, or 503 with ``{"ready": false}``
+                      while the process is still warming up
+    """
+    ready = is_ready()
+    return JsonResponse(
+        {"ready": ready},
+        status=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Cache-Control": "no-store"},
+    )
@@ -0,0 +1,214 @@
+"""
+Idempotent Write Requests
+
+Clients retry writes that time out, and a retried create would geocode the
+location again before failing on the unique name. Requests sent with an
+``Idempotency-Key`` header run at most once per key:
+
+- The first request claims the key by inserting an ``IdempotencyKey`` row,
+  runs, and stores its response in the row. Until then the claim is a lease
+  of ``PROJECTS_IDEMPOTENCY_LEASE_SECONDS`` (default 60): if the worker dies
+  mid-request, a retry after the lease takes the key over.
+- Later requests with the same key and the same method, path and body get
+  the stored response back, marked with ``Idempotent-Replayed: true``.
+- Requests that arrive while the first one is still running wait for its
+  response, for up to ``PROJECTS_IDEMPOTENCY_WAIT_SECONDS`` (default 30),
+  and then get 409 Conflict, unless the lease has expired meanwhile.
+- Reusing a key for a different request is rejected with 422.
+
+Server errors are not stored: the key is released so the request can be
+retried. Stored responses expire after ``PROJECTS_IDEMPOTENCY_TTL_HOURS``
+(default 24) and are deleted by ``purge_idempotency_keys``.
+"""
+import datetime
+import hashlib
+import time
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from rest_framework import status
+
+from .models import IdempotencyKey
+
+HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+DEFAULT_TTL_HOURS = 24
+DEFAULT_WAIT_SECONDS = 30
+DEFAULT_LEASE_SECONDS = 60
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 1.0
+
+
+def ttl():
+    """
+    Return how long stored responses are kept.
+    """
+    return datetime.timedelta(
+        hours=getattr(settings, "PROJECTS_IDEMPOTENCY_TTL_HOURS", DEFAULT_TTL_HOURS)
+    )
+
+
+def lease():
+    """
+    Return how long a key is held for a request that is still running.
+    """
+    return datetime.timedelta(
+        seconds=getattr(settings, "PROJECTS_IDEMPOTENCY_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)
+    )
+
+
+def request_fingerprint(request):
+    """
+    Return a digest identifying a request's method, path and body.
+
+    Args:
+        request (HttpRequest): The request, before its body has been parsed
+
+    Returns:
+        bytes: SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{request.method} {request.get_full_path()}\n".encode())
+    digest.update(request.body)
+    return digest.digest()
+
+
+def claim_key(key, fingerprint):
+    """
+    Claim a key for a new request, or return the row that already holds it.
+
+    Expired rows, whether stored responses or the leases of requests that
+    never finished, are replaced.
+
+    Args:
+        key (str): The idempotency key
+        fingerprint (bytes): The request fingerprint
+
+    Returns:
+        IdempotencyKey | None: The existing row, or None if the key was claimed
+    """
+    while True:
+        try:
+            with transaction.atomic():
+                IdempotencyKey.objects.create(
+                    key=key, fingerprint=fingerprint, expires_at=timezone.now() + lease()
+                )
+            return None
+        except IntegrityError:
+            existing = IdempotencyKey.objects.filter(key=key).first()
+        if existing is None:
+            continue  # released since the insert failed
+        if existing.expires_at > timezone.now():
+            return existing
+        IdempotencyKey.objects.filter(pk=existing.pk, expires_at=existing.expires_at).delete()
+
+
+def wait_for_response(key, timeout):
+    """
+    Poll a claimed key until its response has been stored.
+
+    Args:
+        key (str): The idempotency key
+        timeout (float): Seconds to wait
+
+    Returns:
+        IdempotencyKey | None: The completed row, or None if the key was
+            released, its lease expired or the wait timed out
+    """
+    deadline = time.monotonic() + timeout
+    interval = POLL_INTERVAL
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+        row = IdempotencyKey.objects.filter(key=key).first()
+        if row is None or row.status_code is not None:
+            return row
+        if row.expires_at <= timezone.now():
+            return None
+    return None
+
+
+def replay(row):
+    """
+    Rebuild the stored response of a completed key.
+    """
+    response = HttpResponse(row.body, status=row.status_code, content_type=row.content_type)
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+def idempotent(request, handler):
+    """
+    Run a write request at most once per ``Idempotency-Key``.
+
+    Requests without the header are passed straight to the handler.
+
+    Args:
+        request (HttpRequest): The incoming request
+        handler (Callable[[], HttpResponse]): Runs the request
+
+    Returns:
+        HttpResponse: The handler's response, a replayed response, or an error
+    """
+    key = request.headers.get(HEADER)
+    if key is None:
+        return handler()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return JsonResponse(
+            {"detail": f"{HEADER} must be 1 to {MAX_KEY_LENGTH} characters long."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    fingerprint = request_fingerprint(request)
+    wait = getattr(settings, "PROJECTS_IDEMPOTENCY_WAIT_SECONDS", DEFAULT_WAIT_SECONDS)
+    while (existing := claim_key(key, fingerprint)) is not None:
+        if bytes(existing.fingerprint) != fingerprint:
+            return JsonResponse(
+                {"detail": f"This {HEADER} was already used for a different request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        if existing.status_code is None:
+            existing = wait_for_response(key, wait)
+            held = IdempotencyKey.objects.filter(key=key, expires_at__gt=timezone.now())
+            if existing is None and held.exists():
+                return JsonResponse(
+                    {"detail": f"A request with this {HEADER} is still in progress."},
+                    status=status.HTTP_409_CONFLICT,
+                    headers={"Retry-After": "1"},
+                )
+        if existing is not None:
+            return replay(existing)
+
+    try:
+        response = handler()
+        if hasattr(response, "render"):
+            response.render()
+    except BaseException:
+        IdempotencyKey.objects.filter(key=key).delete()
+        raise
+    if response.status_code >= 500 or response.streaming:
+        IdempotencyKey.objects.filter(key=key).delete()
+    else:
+        IdempotencyKey.objects.filter(key=key).update(
+            status_code=response.status_code,
+            content_type=response.get("Content-Type", ""),
+            body=response.content,
+            expires_at=timezone.now() + ttl(),
+        )
+    return response
+
+
+def purge_expired_keys(now=None):
+    """
+    Delete keys whose stored responses have expired.
+
+    Args:
+        now (datetime | None): Reference time, the current time by default
+
+    Returns:
+        int: Number of keys deleted
+    """
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=now or timezone.now()).delete()
+    return deleted
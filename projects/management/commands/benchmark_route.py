@@ -0,0 +1,70 @@
+"""
+Management command to benchmark route planning.
+
+Plans routes through random stops and reports the runtime and how much
+2-opt and Or-opt improve on the nearest-neighbour route.
+
+Usage:
+    python manage.py benchmark_route [--sizes 50 200 1000] [--budget SECONDS]
+"""
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from projects.route import distance_matrix, plan_route, time_budget
+
+# Stops are scattered over roughly 110 x 100 km around Campinas, SP.
+CENTER = (-22.9, -47.06)
+SPREAD_DEGREES = 0.5
+
+
+class Command(BaseCommand):
+    """
+    Time route planning for several numbers of stops.
+    """
+    help = "Benchmark route planning on random stops."
+
+    def add_arguments(self, parser):
+        """
+        Add the stop counts, time budget and random seed options.
+        """
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[50, 200, 1000],
+            help="Numbers of stops to plan routes for.",
+        )
+        parser.add_argument(
+            "--budget", type=float, default=None,
+            help="Seconds to spend improving each route (PROJECTS_ROUTE_TIME_BUDGET).",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+
+    def handle(self, *args, **options):
+        """
+        Plan one route per size and print a results table.
+        """
+        budget = time_budget() if options["budget"] is None else options["budget"]
+        rng = np.random.default_rng(options["seed"])
+        self.stdout.write(
+            f"{'stops':>6} {'matrix ms':>10} {'initial km':>11} {'final km':>9} "
+            f"{'gain %':>7} {'total s':>8}  converged"
+        )
+        for size in options["sizes"]:
+            latitudes = rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES, size) + CENTER[0]
+            longitudes = rng.uniform(-SPREAD_DEGREES, SPREAD_DEGREES, size) + CENTER[1]
+
+            started = time.perf_counter()
+            distance_matrix(latitudes, longitudes)
+            matrix_ms = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            result = plan_route(latitudes, longitudes, budget=budget)
+            elapsed = time.perf_counter() - started
+
+            initial, final = result["initial_distance_km"], result["distance_km"]
+            gain = (1 - final / initial) * 100 if initial else 0.0
+            self.stdout.write(
+                f"{size:>6} {matrix_ms:>10.1f} {initial:>11.1f} {final:>9.1f} "
+                f"{gain:>7.1f} {elapsed:>8.2f}  {'yes' if result['converged'] else 'no'}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Time budget: {budget:g} s per route."))
@@ -0,0 +1,125 @@
+"""
+Management command to benchmark process startup.
+
+Starts fresh interpreters and measures how long Django setup, the warm-up
+and the first requests take, with and without warm-up, and which packages
+dominate import time.
+
+Usage:
+    python manage.py benchmark_startup [--runs 5] [--path /api/schema.json]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup = time.perf_counter() - started
+from django.test import Client
+client = Client()
+warm_up = 0.0
+if sys.argv[2] == "warm":
+    from projects.health import warm_up as run_warm_up
+    warm_up = run_warm_up()
+before = time.perf_counter()
+status = client.get(sys.argv[1]).status_code
+first = time.perf_counter() - before
+before = time.perf_counter()
+client.get(sys.argv[1])
+second = time.perf_counter() - before
+print(json.dumps({
+    "setup": setup, "warm_up": warm_up, "first": first, "second": second, "status": status,
+}))
+"""
+PACKAGES = ("django", "rest_framework", "drf_yasg", "requests", "numpy", "projects")
+
+
+def parse_import_times(output):
+    """
+    Sum the time spent importing each package's own modules.
+
+    Self times exclude nested imports, so each module is counted once, in
+    the package it belongs to.
+
+    Args:
+        output (str): Standard error of ``python -X importtime``
+
+    Returns:
+        dict[str, float]: Seconds per top-level package
+    """
+    totals = defaultdict(float)
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        totals[name.strip().split(".")[0]] += int(own) / 1_000_000
+    return totals
+
+
+class Command(BaseCommand):
+    """
+    Measure import time and time to first request in fresh processes.
+    """
+    help = "Benchmark import time and time to first request."
+
+    def add_arguments(self, parser):
+        """
+        Add the number of runs and the request path options.
+        """
+        parser.add_argument("--runs", type=int, default=5, help="Processes to start per mode.")
+        parser.add_argument(
+            "--path", default="/api/schema.json", help="Path of the first request."
+        )
+
+    def _run(self, path, mode):
+        """
+        Start one process and return its timings and import times.
+        """
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "geo_projects_service.settings"
+        )}
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", SCRIPT, path, mode],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        return json.loads(result.stdout.splitlines()[-1]), parse_import_times(result.stderr)
+
+    def handle(self, *args, **options):
+        """
+        Run the benchmark in cold and warm mode and print the medians.
+        """
+        imports = defaultdict(list)
+        self.stdout.write(
+            f"{'mode':<5} {'setup ms':>9} {'warm-up ms':>11} {'1st req ms':>11} "
+            f"{'2nd req ms':>11} {'to 1st response ms':>19}  status"
+        )
+        for mode in ("cold", "warm"):
+            runs = [self._run(options["path"], mode) for _ in range(options["runs"])]
+            if mode == "warm":  # warm processes import everything
+                for _, totals in runs:
+                    for package in PACKAGES:
+                        imports[package].append(totals.get(package, 0.0))
+
+            def median_ms(field, runs=runs):
+                return statistics.median(timings[field] for timings, _ in runs) * 1000
+
+            total = median_ms("setup") + median_ms("warm_up") + median_ms("first")
+            self.stdout.write(
+                f"{mode:<5} {median_ms('setup'):>9.1f} {median_ms('warm_up'):>11.1f} "
+                f"{median_ms('first'):>11.1f} {median_ms('second'):>11.1f} {total:>19.1f}"
+                f"  {runs[0][0]['status']}"
+            )
+
+        self.stdout.write("Median import time by package (own modules, warm processes):")
+        for package in PACKAGES:
+            median = statistics.median(imports[package]) * 1000
+            self.stdout.write(f"  {package:<15} {median:>8.1f} ms")
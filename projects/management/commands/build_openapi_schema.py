@@ -0,0 +1,37 @@
+"""
+Management command to build the OpenAPI schema artifact.
+
+Run at image build time so that the service serves a precomputed schema.
+
+Usage:
+    python manage.py build_openapi_schema [--output PATH]
+"""
+from django.core.management.base import BaseCommand
+
+from projects.schema import schema_path, write_schema
+
+
+class Command(BaseCommand):
+    """
+    Generate the OpenAPI schema and write it to ``PROJECTS_SCHEMA_PATH``.
+    """
+    help = "Generate the OpenAPI schema and write it to a static file."
+
+    def add_arguments(self, parser):
+        """
+        Add the output path option.
+        """
+        parser.add_argument(
+            "--output", default=None,
+            help="Where to write the schema (defaults to PROJECTS_SCHEMA_PATH).",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Write the schema and report its location and size.
+        """
+        output = options["output"] or schema_path()
+        content = write_schema(output)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote OpenAPI schema to {output} ({len(content)} bytes)."
+        ))
@@ -0,0 +1,25 @@
+"""
+Management command to prune the project change log.
+
+Usage:
+    python manage.py prune_project_changes
+"""
+from django.core.management.base import BaseCommand
+
+from projects.changes import prune_changes, retention_days
+
+
+class Command(BaseCommand):
+    """
+    Delete change log entries and tombstones older than the retention window.
+    """
+    help = "Delete project change log entries older than the retention window."
+
+    def handle(self, *args, **options):
+        """
+        Run the pruning and report how many entries were deleted.
+        """
+        deleted = prune_changes()
+        self.stdout.write(self.style.SUCCESS(
+            f"Pruned {deleted} change(s) older than {retention_days()} day(s)."
+        ))
@@ -0,0 +1,23 @@
+"""
+Management command to purge expired idempotency keys.
+
+Usage:
+    python manage.py purge_idempotency_keys
+"""
+from django.core.management.base import BaseCommand
+
+from projects.idempotency import purge_expired_keys
+
+
+class Command(BaseCommand):
+    """
+    Delete idempotency keys whose stored responses have expired.
+    """
+    help = "Delete expired idempotency keys and their stored responses."
+
+    def handle(self, *args, **options):
+        """
+        Run the purge and report how many keys were deleted.
+        """
+        deleted = purge_expired_keys()
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} expired idempotency key(s)."))
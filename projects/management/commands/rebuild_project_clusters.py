@@ -0,0 +1,23 @@
+"""
+Management command to rebuild the map cluster grid.
+
+Usage:
+    python manage.py rebuild_project_clusters
+"""
+from django.core.management.base import BaseCommand
+
+from projects.clusters import rebuild_clusters
+
+
+class Command(BaseCommand):
+    """
+    Recompute every ``ProjectCluster`` cell from project coordinates.
+    """
+    help = "Rebuild the map cluster grid from project coordinates."
+
+    def handle(self, *args, **options):
+        """
+        Run the rebuild and report how many cells were written.
+        """
+        cells = rebuild_clusters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt clusters: {cells} cell(s) written."))
@@ -0,0 +1,25 @@
+"""
+Management command to rebuild the project statistics summary table.
+
+Usage:
+    python manage.py reconcile_project_stats
+"""
+from django.core.management.base import BaseCommand
+
+from projects.summaries import reconcile_statistics
+
+
+class Command(BaseCommand):
+    """
+    Recompute ``ProjectStatistic`` rows from the Project table and fix any drift.
+    """
+    help = "Rebuild the project statistics summary table from the Project table."
+
+    def handle(self, *args, **options):
+        """
+        Run the reconciliation and report how many groups were corrected.
+        """
+        drifted = reconcile_statistics()
+        self.stdout.write(
+            self.style.SUCCESS(f"Reconciled statistics: {drifted} group(s) corrected.")
+        )
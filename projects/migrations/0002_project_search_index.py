@@ -0,0 +1,90 @@
+from django.db import migrations
+
+# The SQL is copied here rather than imported from projects.search, so that
+# later changes to that module cannot change what this migration does.
+SQLITE_INSTALL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS projects_project_fts USING fts5(
+        name, location, description,
+        content='projects_project', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_ai AFTER INSERT ON projects_project BEGIN
+        INSERT INTO projects_project_fts(rowid, name, location, description)
+        VALUES (new.id, new.name, new.location, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_ad AFTER DELETE ON projects_project BEGIN
+        INSERT INTO projects_project_fts(projects_project_fts, rowid, name, location, description)
+        VALUES ('delete', old.id, old.name, old.location, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_project_fts_au
+    AFTER UPDATE OF name, location, description ON projects_project BEGIN
+        INSERT INTO projects_project_fts(projects_project_fts, rowid, name, location, description)
+        VALUES ('delete', old.id, old.name, old.location, old.description);
+        INSERT INTO projects_project_fts(rowid, name, location, description)
+        VALUES (new.id, new.name, new.location, new.description);
+    END
+    """,
+    "INSERT INTO projects_project_fts(projects_project_fts) VALUES ('rebuild')",
+)
+
+SQLITE_UNINSTALL = (
+    "DROP TRIGGER IF EXISTS projects_project_fts_ai",
+    "DROP TRIGGER IF EXISTS projects_project_fts_ad",
+    "DROP TRIGGER IF EXISTS projects_project_fts_au",
+    "DROP TABLE IF EXISTS projects_project_fts",
+)
+
+POSTGRES_INSTALL = (
+    """
+    ALTER TABLE projects_project ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(location, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS projects_project_search_vector_idx
+    ON projects_project USING GIN (search_vector)
+    """,
+)
+
+POSTGRES_UNINSTALL = (
+    "DROP INDEX IF EXISTS projects_project_search_vector_idx",
+    "ALTER TABLE projects_project DROP COLUMN IF EXISTS search_vector",
+)
+
+STATEMENTS = {
+    "sqlite": (SQLITE_INSTALL, SQLITE_UNINSTALL),
+    "postgresql": (POSTGRES_INSTALL, POSTGRES_UNINSTALL),
+}
+
+
+def forwards(apps, schema_editor):
+    install, _ = STATEMENTS.get(schema_editor.connection.vendor, ((), ()))
+    for statement in install:
+        schema_editor.execute(statement, params=None)
+
+
+def backwards(apps, schema_editor):
+    _, uninstall = STATEMENTS.get(schema_editor.connection.vendor, ((), ()))
+    for statement in uninstall:
+        schema_editor.execute(statement, params=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:05
+
+import math
+from collections import Counter
+
+from django.db import migrations, models
+
+# Grouping rules as of this migration; kept here rather than imported from
+# projects.summaries so that later changes to it do not alter this migration.
+CELL_SIZE_DEGREES = 1
+UNLOCATED_CELL = "unlocated"
+
+
+def cell_key(latitude, longitude):
+    if latitude is None or longitude is None:
+        return UNLOCATED_CELL
+    lat = math.floor(float(latitude) / CELL_SIZE_DEGREES) * CELL_SIZE_DEGREES
+    lng = math.floor(float(longitude) / CELL_SIZE_DEGREES) * CELL_SIZE_DEGREES
+    return f"{lat},{lng}"
+
+
+def populate_statistics(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectStatistic = apps.get_model("projects", "ProjectStatistic")
+    counts = Counter()
+    rows = Project.objects.values_list("status", "start_date", "latitude", "longitude")
+    for status, start_date, latitude, longitude in rows.iterator():
+        counts["status", status] += 1
+        counts["start_month", str(start_date)[:7]] += 1
+        counts["cell", cell_key(latitude, longitude)] += 1
+    ProjectStatistic.objects.bulk_create(
+        ProjectStatistic(dimension=dimension, key=key, count=count)
+        for (dimension, key), count in counts.items()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStatistic',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('status', 'Status'), ('start_month', 'Start month'), ('cell', 'Geographic cell')], help_text='The attribute projects are grouped by.', max_length=20)),
+                ('key', models.CharField(help_text='The group value, e.g. a status, a YYYY-MM month or a cell.', max_length=64)),
+                ('count', models.BigIntegerField(default=0, help_text='Number of projects in the group.')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='projectstatistic',
+            constraint=models.UniqueConstraint(fields=('dimension', 'key'), name='project_statistic_unique_key'),
+        ),
+        migrations.RunPython(populate_statistics, migrations.RunPython.noop),
+    ]
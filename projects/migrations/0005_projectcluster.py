@@ -0,0 +1,79 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:07
+
+import math
+from collections import defaultdict
+
+from django.db import migrations, models
+
+# Grid rules as of this migration; kept here rather than imported from
+# projects.clusters so that later changes to it do not alter this migration.
+MAX_ZOOM = 16
+CELL_BITS = 3
+MAX_LATITUDE = 85.05112878
+
+
+def cell_for(latitude, longitude, zoom):
+    size = 1 << (zoom + CELL_BITS)
+    lat = math.radians(max(-MAX_LATITUDE, min(MAX_LATITUDE, float(latitude))))
+    x = (float(longitude) + 180.0) / 360.0 * size
+    y = (1.0 - math.asinh(math.tan(lat)) / math.pi) / 2.0 * size
+    return min(max(int(x), 0), size - 1), min(max(int(y), 0), size - 1)
+
+
+def populate_clusters(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectCluster = apps.get_model("projects", "ProjectCluster")
+    cells = defaultdict(lambda: [0, 0.0, 0.0])
+    coordinates = (
+        Project.objects
+        .filter(latitude__isnull=False, longitude__isnull=False)
+        .values_list("latitude", "longitude")
+    )
+    for latitude, longitude in coordinates.iterator(chunk_size=2000):
+        lat, lng = float(latitude), float(longitude)
+        for zoom in range(MAX_ZOOM + 1):
+            cell = cells[(zoom, *cell_for(lat, lng, zoom))]
+            cell[0] += 1
+            cell[1] += lat
+            cell[2] += lng
+    ProjectCluster.objects.bulk_create(
+        (
+            ProjectCluster(
+                zoom=zoom, cell_x=x, cell_y=y,
+                count=count, latitude_sum=lat_sum, longitude_sum=lng_sum,
+            )
+            for (zoom, x, y), (count, lat_sum, lng_sum) in cells.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_projectstatistic'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField(help_text='Map zoom level of the grid.')),
+                ('cell_x', models.PositiveIntegerField(help_text='Grid column, counted eastwards from longitude -180.')),
+                ('cell_y', models.PositiveIntegerField(help_text='Grid row, counted southwards from the Web Mercator north edge.')),
+                ('count', models.BigIntegerField(default=0, help_text='Number of projects in the cell.')),
+                ('latitude_sum', models.FloatField(default=0, help_text='Sum of project latitudes, used to compute the centroid.')),
+                ('longitude_sum', models.FloatField(default=0, help_text='Sum of project longitudes, used to compute the centroid.')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['latitude', 'longitude'], name='project_coordinates_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='projectcluster',
+            constraint=models.UniqueConstraint(fields=('zoom', 'cell_x', 'cell_y'), name='project_cluster_unique_cell'),
+        ),
+        migrations.RunPython(populate_clusters, migrations.RunPython.noop),
+    ]
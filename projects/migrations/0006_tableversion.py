@@ -0,0 +1,21 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_projectcluster'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Name of the versioned table.', max_length=64, unique=True)),
+                ('version', models.BigIntegerField(default=0, help_text='Incremented on every change to the table.')),
+            ],
+        ),
+    ]
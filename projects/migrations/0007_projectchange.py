@@ -0,0 +1,22 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_tableversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectChange',
+            fields=[
+                ('seq', models.BigAutoField(help_text='Monotonically increasing change sequence number.', primary_key=True, serialize=False)),
+                ('project_uuid', models.UUIDField(help_text='UUID of the changed project.')),
+                ('operation', models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('deleted', 'Deleted')], help_text='The kind of change.', max_length=10)),
+                ('changed_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='When the change was recorded.')),
+            ],
+        ),
+    ]
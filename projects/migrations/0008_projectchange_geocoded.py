@@ -0,0 +1,18 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_projectchange'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectchange',
+            name='operation',
+            field=models.CharField(choices=[('created', 'Created'), ('updated', 'Updated'), ('geocoded', 'Geocoded'), ('deleted', 'Deleted')], help_text='The kind of change.', max_length=10),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.21 on 2026-10-19 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_projectchange_geocoded'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='The client-supplied idempotency key.', max_length=255, unique=True)),
+                ('fingerprint', models.BinaryField(help_text='SHA-256 digest of the request method, path and body.', max_length=32)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, help_text='Status of the stored response; empty while the request runs.', null=True)),
+                ('content_type', models.CharField(blank=True, help_text='Content type of the stored response.', max_length=100)),
+                ('body', models.BinaryField(blank=True, default=b'', help_text='Body of the stored response.')),
+                ('expires_at', models.DateTimeField(db_index=True, help_text='When the key may be reused and the row purged.')),
+            ],
+        ),
+    ]
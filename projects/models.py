@@ -65,6 +65,21 @@ class Project(models.Model):
         help_text="Longitude coordinate of the validated location."
     )
 
+    class Meta:
+        """
+        Metadata options for the Project model.
+
+        Attributes:
+            indexes (list): Indexes backing the admin status filter and
+                            start date hierarchy on large tables, and
+                            coordinate range queries.
+        """
+        indexes = [
+            models.Index(fields=["status", "start_date"], name="project_status_start_idx"),
+            models.Index(fields=["start_date"], name="project_start_date_idx"),
+            models.Index(fields=["latitude", "longitude"], name="project_coordinates_idx"),
+        ]
+
     def __str__(self):
         """
         String representation of the Project instance.
@@ -73,3 +88,228 @@ class Project(models.Model):
             str: The project name for display purposes.
         """
         return self.name
+
+
+class ProjectStatistic(models.Model):
+    """
+    A pre-aggregated project count for one value of one dimension.
+
+    Rows are maintained incrementally on every project write (see
+    ``projects.summaries``) so that statistics can be served without scanning
+    the Project table. The ``reconcile_project_stats`` management command
+    rebuilds them from scratch.
+    """
+
+    DIMENSION_CHOICES = [
+        ("status", "Status"),
+        ("start_month", "Start month"),
+        ("cell", "Geographic cell"),
+    ]
+
+    dimension = models.CharField(
+        max_length=20, choices=DIMENSION_CHOICES,
+        help_text="The attribute projects are grouped by."
+    )
+    key = models.CharField(
+        max_length=64,
+        help_text="The group value, e.g. a status, a YYYY-MM month or a cell."
+    )
+    count = models.BigIntegerField(
+        default=0,
+        help_text="Number of projects in the group."
+    )
+
+    class Meta:
+        """
+        Metadata options for the ProjectStatistic model.
+
+        Attributes:
+            constraints (list): One row per dimension and key.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "key"], name="project_statistic_unique_key"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the ProjectStatistic instance.
+
+        Returns:
+            str: The dimension, key and count.
+        """
+        return f"{self.dimension}={self.key}: {self.count}"
+
+
+class ProjectCluster(models.Model):
+    """
+    A pre-aggregated group of projects in one map grid cell at one zoom level.
+
+    The grid follows Web Mercator tiles: at zoom ``z`` each tile is split into
+    ``2 ** CELL_BITS`` cells per axis (see ``projects.clusters``). Rows are
+    maintained incrementally on every project write, so clusters for a map
+    view are read without touching the Project table.
+    """
+
+    zoom = models.PositiveSmallIntegerField(
+        help_text="Map zoom level of the grid."
+    )
+    cell_x = models.PositiveIntegerField(
+        help_text="Grid column, counted eastwards from longitude -180."
+    )
+    cell_y = models.PositiveIntegerField(
+        help_text="Grid row, counted southwards from the Web Mercator north edge."
+    )
+    count = models.BigIntegerField(
+        default=0,
+        help_text="Number of projects in the cell."
+    )
+    latitude_sum = models.FloatField(
+        default=0,
+        help_text="Sum of project latitudes, used to compute the centroid."
+    )
+    longitude_sum = models.FloatField(
+        default=0,
+        help_text="Sum of project longitudes, used to compute the centroid."
+    )
+
+    class Meta:
+        """
+        Metadata options for the ProjectCluster model.
+
+        Attributes:
+            constraints (list): One row per zoom level and cell; the backing
+                                index also serves viewport range queries.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=["zoom", "cell_x", "cell_y"], name="project_cluster_unique_cell"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the ProjectCluster instance.
+
+        Returns:
+            str: The zoom level, cell and count.
+        """
+        return f"z{self.zoom} ({self.cell_x}, {self.cell_y}): {self.count}"
+
+
+class TableVersion(models.Model):
+    """
+    A counter that increases whenever the data of a named table changes.
+
+    Used to key caches of derived data, such as exports, so that they are
+    invalidated by any write without comparing the data itself.
+    """
+
+    name = models.CharField(
+        max_length=64, unique=True,
+        help_text="Name of the versioned table."
+    )
+    version = models.BigIntegerField(
+        default=0,
+        help_text="Incremented on every change to the table."
+    )
+
+    def __str__(self):
+        """
+        String representation of the TableVersion instance.
+
+        Returns:
+            str: The table name and version.
+        """
+        return f"{self.name} v{self.version}"
+
+
+class ProjectChange(models.Model):
+    """
+    An entry in the append-only log of project changes.
+
+    Every create, update and delete of a project appends one entry (see
+    ``projects.changes``); updates that change coordinates are recorded as
+    ``geocoded``. Entries are ordered by ``seq``, a monotonically
+    increasing sequence that clients use as a sync cursor. Entries older than
+    the retention window are pruned, so deletions remain visible as
+    tombstones for that long.
+    """
+
+    OPERATION_CHOICES = [
+        ("created", "Created"),
+        ("updated", "Updated"),
+        ("geocoded", "Geocoded"),
+        ("deleted", "Deleted"),
+    ]
+
+    seq = models.BigAutoField(
+        primary_key=True,
+        help_text="Monotonically increasing change sequence number."
+    )
+    project_uuid = models.UUIDField(
+        help_text="UUID of the changed project."
+    )
+    operation = models.CharField(
+        max_length=10, choices=OPERATION_CHOICES,
+        help_text="The kind of change."
+    )
+    changed_at = models.DateTimeField(
+        auto_now_add=True, db_index=True,
+        help_text="When the change was recorded."
+    )
+
+    def __str__(self):
+        """
+        String representation of the ProjectChange instance.
+
+        Returns:
+            str: The sequence number, operation and project UUID.
+        """
+        return f"#{self.seq} {self.operation} {self.project_uuid}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    The outcome of a write request sent with an ``Idempotency-Key`` header.
+
+    The row is claimed before the request runs and completed with its
+    response, so retries of the same request replay that response instead of
+    running it again (see ``projects.idempotency``). Rows are kept until
+    ``expires_at``.
+    """
+
+    key = models.CharField(
+        max_length=255, unique=True,
+        help_text="The client-supplied idempotency key."
+    )
+    fingerprint = models.BinaryField(
+        max_length=32,
+        help_text="SHA-256 digest of the request method, path and body."
+    )
+    status_code = models.PositiveSmallIntegerField(
+        null=True, blank=True,
+        help_text="Status of the stored response; empty while the request runs."
+    )
+    content_type = models.CharField(
+        max_length=100, blank=True,
+        help_text="Content type of the stored response."
+    )
+    body = models.BinaryField(
+        blank=True, default=b"",
+        help_text="Body of the stored response."
+    )
+    expires_at = models.DateTimeField(
+        db_index=True,
+        help_text="When the key may be reused and the row purged."
+    )
+
+    def __str__(self):
+        """
+        String representation of the IdempotencyKey instance.
+
+        Returns:
+            str: The key and the stored response status, if any.
+        """
+        return f"{self.key} ({self.status_code or 'in progress'})"
@@ -0,0 +1,163 @@
+"""
+Pagination Classes for the Projects API and Admin
+
+This module defines the pagination styles used by Project endpoints that can
+return large result sets, and a paginator that lets the admin changelist avoid
+exact ``COUNT(*)`` queries over very large tables.
+"""
+import random
+
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+from django.db.models import Max
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+ESTIMATE_SAMPLE_SIZE = 500
+
+
+class ProjectSearchPagination(PageNumberPagination):
+    """
+    Page-number pagination for full-text search results.
+
+    Clients may choose a page size via ``?page_size=`` up to ``max_page_size``.
+
+    Attributes:
+        page_size (int): Default number of results per page
+        page_size_query_param (str): Query parameter to override the page size
+        max_page_size (int): Upper bound for client-requested page sizes
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+def _sampled_estimate(queryset, total):
+    """
+    Scale a table row estimate by the share of sampled rows a filter matches.
+
+    The sample is up to ``ESTIMATE_SAMPLE_SIZE`` primary keys spread over the
+    whole key range and looked up by key, so its cost does not grow with the
+    table. A fixed seed keeps the estimate, and so the page count, stable
+    between requests.
+
+    Args:
+        queryset (QuerySet): The filtered queryset
+        total (int): Estimated number of rows in the unfiltered table
+
+    Returns:
+        int | None: The estimated row count, or None if no sampled key exists
+    """
+    rows = queryset.model._default_manager.using(queryset.db)  # pylint: disable=protected-access
+    highest = rows.aggregate(highest=Max("pk"))["highest"]
+    if not highest:
+        return None
+    sampler = random.Random(queryset.model._meta.db_table)
+    sample = sorted({sampler.randint(1, highest) for _ in range(ESTIMATE_SAMPLE_SIZE)})
+    existing = rows.filter(pk__in=sample).count()
+    if not existing:
+        return None
+    matching = queryset.filter(pk__in=sample).count()
+    return round(total * matching / existing)
+
+
+def estimate_count(queryset):
+    """
+    Estimate the number of rows a queryset returns without counting them.
+
+    Unfiltered querysets use table statistics (``pg_class.reltuples`` on
+    PostgreSQL, ``sqlite_stat1`` or the highest primary key on SQLite).
+    Filtered querysets use the PostgreSQL planner estimate, or on SQLite the
+    table estimate scaled by the share of a key sample the filter matches.
+
+    Args:
+        queryset (QuerySet): The queryset to estimate
+
+    Returns:
+        int | None: The estimated row count, or None if no estimate is available
+    """
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    filtered = bool(queryset.query.where)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            if filtered:
+                sql, params = queryset.query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                return int(plan[0]["Plan"]["Plan Rows"])
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table]
+            )
+            row = cursor.fetchone()
+            return row[0] if row and row[0] >= 0 else None
+
+        if connection.vendor != "sqlite":
+            return None
+        total = None
+        if "sqlite_stat1" in connection.introspection.table_names(cursor):
+            cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = %s AND idx IS NULL", [table]
+            )
+            row = cursor.fetchone()
+            if row:
+                total = int(row[0].split()[0])
+        if total is None:
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table}"')
+            total = cursor.fetchone()[0] or 0
+    return _sampled_estimate(queryset, total) if filtered else total
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that counts exactly only while the result set is small.
+
+    Counting stops after ``exact_count_limit`` rows. Larger result sets report
+    an estimate from ``estimate_count`` instead, but never less than the rows
+    already counted. Since an estimate may fall short, pages past it are still
+    served as long as they contain rows.
+
+    Attributes:
+        exact_count_limit (int): Largest result set that is counted exactly
+        count_is_estimate (bool): Whether ``count`` is an estimate
+    """
+    exact_count_limit = 10_000
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        """
+        Return the exact or estimated total number of objects.
+        """
+        queryset = self.object_list
+        counted = queryset[: self.exact_count_limit + 1].count()
+        if counted <= self.exact_count_limit:
+            return counted
+        self.count_is_estimate = True
+        return max(estimate_count(queryset) or 0, counted)
+
+    def validate_number(self, number):
+        """
+        Validate a page number, accepting pages past an estimated count that
+        still contain rows.
+        """
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            number = int(number)
+            if not (self.count_is_estimate and number > self.num_pages):
+                raise
+            if not self.object_list[(number - 1) * self.per_page:].exists():
+                raise
+            return number
+
+    def page(self, number):
+        """
+        Return the page with the given 1-based number.
+        """
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        if bottom < self.count:
+            return super().page(number)
+        return self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
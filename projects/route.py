@@ -0,0 +1,273 @@
+"""
+Visit Route Optimisation
+
+This module orders a set of stops into a short open path, optionally from a
+fixed start point, for field teams visiting project sites:
+
+1. The great-circle distance matrix of all stops is built in one vectorized
+   haversine pass.
+2. A nearest-neighbour tour gives the initial order.
+3. The order is improved with 2-opt (reversing a segment) and Or-opt (moving
+   a segment of up to ``OR_OPT_MAX_LENGTH`` stops, possibly reversed) moves
+   until no move shortens the path or the time budget runs out. Each step
+   evaluates every candidate move of its kind with NumPy and applies the best.
+
+The path is stored as ``[head, stop, ..., stop, end]``, where ``end`` is a
+virtual node at zero distance from every other node and ``head`` is either
+the start point or ``end`` itself. Moves only rearrange the stops in between,
+so the same operators serve paths with and without a fixed start.
+"""
+import time
+
+import numpy as np
+from django.conf import settings
+
+EARTH_RADIUS_KM = 6371.0088
+OR_OPT_MAX_LENGTH = 3
+DEFAULT_TIME_BUDGET = 2.0
+IMPROVEMENT_EPSILON = 1e-9
+
+
+def distance_matrix(latitudes, longitudes):
+    """
+    Return the great-circle distances between all pairs of points.
+
+    Args:
+        latitudes (numpy.ndarray): Point latitudes in degrees
+        longitudes (numpy.ndarray): Point longitudes in degrees
+
+    Returns:
+        numpy.ndarray: ``(n, n)`` distances in kilometres
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lng = np.radians(np.asarray(longitudes, dtype=np.float64))
+    half_dlat = np.sin((lat[:, np.newaxis] - lat) / 2)
+    half_dlng = np.sin((lng[:, np.newaxis] - lng) / 2)
+    a = half_dlat ** 2 + np.cos(lat)[:, np.newaxis] * np.cos(lat) * half_dlng ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def path_length(distances, path):
+    """
+    Return the total length of a path through a distance matrix.
+    """
+    path = np.asarray(path)
+    return float(distances[path[:-1], path[1:]].sum())
+
+
+def nearest_neighbour(distances, first, stops):
+    """
+    Build a path that always visits the closest unvisited stop next.
+
+    Args:
+        distances (numpy.ndarray): Distance matrix including the virtual nodes
+        first (int): Stop the path starts with
+        stops (int): Number of stops, numbered ``0..stops - 1``
+
+    Returns:
+        list[int]: The stops in visiting order
+    """
+    unvisited = np.ones(stops, dtype=bool)
+    unvisited[first] = False
+    order = [first]
+    for _ in range(stops - 1):
+        row = np.where(unvisited, distances[order[-1], :stops], np.inf)
+        order.append(int(np.argmin(row)))
+        unvisited[order[-1]] = False
+    return order
+
+
+def two_opt_step(distances, path):
+    """
+    Apply improving segment reversals, if any shorten the path.
+
+    The best reversal starting at each position is evaluated at once; the
+    most improving ones whose edges do not overlap are then applied
+    together, since they do not affect each other's gain.
+
+    Args:
+        distances (numpy.ndarray): Distance matrix including the virtual nodes
+        path (numpy.ndarray): ``[head, stops..., end]``
+
+    Returns:
+        numpy.ndarray | None: The improved path, or None at a local optimum
+    """
+    before, stops, after = path[:-2], path[1:-1], path[2:]
+    # Reversing stops[i..j] replaces edges (before[i], stops[i]) and
+    # (stops[j], after[j]) with (before[i], stops[j]) and (stops[i], after[j]).
+    delta = (
+        distances[before[:, np.newaxis], stops]
+        + distances[stops[:, np.newaxis], after]
+        - distances[before, stops][:, np.newaxis]
+        - distances[stops, after]
+    )
+    delta[np.tril_indices(len(stops))] = 0.0
+    ends = np.argmin(delta, axis=1)
+    gains = delta[np.arange(len(stops)), ends]
+    (starts,) = np.nonzero(gains < -IMPROVEMENT_EPSILON)
+    if starts.size == 0:
+        return None
+
+    path = path.copy()
+    # A reversal of stops[i..j] changes path edges i..j + 1.
+    used = np.zeros(len(path) - 1, dtype=bool)
+    for i in starts[np.argsort(gains[starts])]:
+        j = ends[i]
+        if not used[i:j + 2].any():
+            used[i:j + 2] = True
+            path[i + 1:j + 2] = path[i + 1:j + 2][::-1]
+    return path
+
+
+def _insertion_costs(distances, path, first, last):
+    """
+    Return the cost of inserting each segment into each edge of the path.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Segments-by-edges costs of
+            inserting the segments forwards and reversed
+    """
+    edge_from, edge_to = path[:-1], path[1:]
+    edge_length = distances[edge_from, edge_to]
+    forward = (
+        distances[edge_from, first[:, np.newaxis]]
+        + distances[last[:, np.newaxis], edge_to] - edge_length
+    )
+    reverse = (
+        distances[edge_from, last[:, np.newaxis]]
+        + distances[first[:, np.newaxis], edge_to] - edge_length
+    )
+    return forward, reverse
+
+
+def _or_opt_moves(distances, path, length):
+    """
+    Return the best improving move of each segment of ``length`` stops.
+
+    Returns:
+        list[tuple]: ``(delta, k, edge, flipped)`` moves, where the segment
+            ``path[k + 1..k + length]`` is inserted after ``path[edge]``,
+            reversed if ``flipped``
+    """
+    # Segment k covers path[k + 1..k + length].
+    first, last = path[1:len(path) - length], path[length:-1]
+    before, after = path[:len(path) - length - 1], path[length + 1:]
+    removal_gain = (
+        distances[before, first] + distances[last, after] - distances[before, after]
+    )
+    forward, reverse = _insertion_costs(distances, path, first, last)
+    delta = np.minimum(forward, reverse) - removal_gain[:, np.newaxis]
+    # Edges k..k + length touch the segment and are not insertion points.
+    offset = np.arange(len(path) - 1) - np.arange(len(first))[:, np.newaxis]
+    delta[(offset >= 0) & (offset <= length)] = np.inf
+
+    targets = np.argmin(delta, axis=1)
+    gains = np.min(delta, axis=1)
+    return [
+        (gains[k], k, targets[k], reverse[k, targets[k]] < forward[k, targets[k]])
+        for k in np.nonzero(gains < -IMPROVEMENT_EPSILON)[0]
+    ]
+
+
+def or_opt_step(distances, path):
+    """
+    Apply improving moves of short segments to other positions, if any help.
+
+    Segments of 1 to ``OR_OPT_MAX_LENGTH`` stops are tried, inserted forwards
+    or reversed between any two consecutive nodes outside the segment. As
+    with ``two_opt_step``, the best move of each segment is evaluated at once
+    and the most improving moves whose edges do not overlap are applied.
+
+    Args:
+        distances (numpy.ndarray): Distance matrix including the virtual nodes
+        path (numpy.ndarray): ``[head, stops..., end]``
+
+    Returns:
+        numpy.ndarray | None: The improved path, or None at a local optimum
+    """
+    moves = [
+        (delta, k, edge, length, flipped)
+        for length in range(1, min(OR_OPT_MAX_LENGTH, len(path) - 3) + 1)
+        for delta, k, edge, flipped in _or_opt_moves(distances, path, length)
+    ]
+    if not moves:
+        return None
+
+    path = path.copy()
+    used = np.zeros(len(path) - 1, dtype=bool)
+    for _, k, edge, length, flipped in sorted(moves, key=lambda move: move[0]):
+        # A move only reorders the nodes between its edges.
+        low, high = min(k, edge), max(k + length, edge)
+        if used[low:high + 1].any():
+            continue
+        used[low:high + 1] = True
+        moved = path[k + 1:k + length + 1][::-1 if flipped else 1].copy()
+        if edge < k:
+            path[edge + 1:k + length + 1] = np.concatenate((moved, path[edge + 1:k + 1]))
+        else:
+            path[k + 1:edge + 1] = np.concatenate((path[k + length + 1:edge + 1], moved))
+    return path
+
+
+def time_budget():
+    """
+    Return the default optimisation time budget in seconds.
+    """
+    return getattr(settings, "PROJECTS_ROUTE_TIME_BUDGET", DEFAULT_TIME_BUDGET)
+
+
+def plan_route(latitudes, longitudes, start=None, budget=None):
+    """
+    Order stops into a short open path.
+
+    Args:
+        latitudes (Sequence[float]): Stop latitudes, at least one
+        longitudes (Sequence[float]): Stop longitudes
+        start (tuple[float, float] | None): ``(latitude, longitude)`` the path
+            must start from; the path starts at any stop if None
+        budget (float | None): Seconds to spend improving the path, the
+            ``PROJECTS_ROUTE_TIME_BUDGET`` setting by default
+
+    Returns:
+        dict: ``order`` (stop indexes in visiting order), ``distance_km``
+              (total path length including the leg from ``start``),
+              ``initial_distance_km`` (length of the nearest-neighbour path)
+              and ``converged`` (whether a local optimum was reached within
+              the budget)
+    """
+    deadline = time.monotonic() + (time_budget() if budget is None else budget)
+    stops = len(latitudes)
+    if start is not None:
+        latitudes = [*latitudes, start[0]]
+        longitudes = [*longitudes, start[1]]
+    # The last row and column are the virtual end node.
+    distances = np.zeros((stops + 2, stops + 2))
+    distances[:len(latitudes), :len(latitudes)] = distance_matrix(latitudes, longitudes)
+    end = stops + 1
+    head = stops if start is not None else end
+
+    if start is None:
+        # Without a start, begin at the most outlying stop.
+        first = int(np.argmax(distances[:stops, :stops].sum(axis=1)))
+    else:
+        first = int(np.argmin(distances[head, :stops]))
+    order = nearest_neighbour(distances, first, stops)
+    path = np.array([head, *order, end])
+    initial = path_length(distances, path)
+
+    converged = False
+    while time.monotonic() < deadline:
+        improved = two_opt_step(distances, path)
+        if improved is None:
+            improved = or_opt_step(distances, path)
+        if improved is None:
+            converged = True
+            break
+        path = improved
+
+    return {
+        "order": path[1:-1].tolist(),
+        "distance_km": path_length(distances, path),
+        "initial_distance_km": initial,
+        "converged": converged,
+    }
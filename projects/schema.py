@@ -0,0 +1,176 @@
+"""
+Precomputed OpenAPI Schema
+
+Generating the OpenAPI schema walks every route and serializer, and drf_yasg
+is slow to import. Instead of generating the schema on every request, the
+``build_openapi_schema`` command writes it once, at image build time, to
+``PROJECTS_SCHEMA_PATH``. The service reads that file into memory once and
+serves it with an ETag. The ReDoc page links to the schema with its content
+hash in the query string; such versioned URLs are cached for a year, since
+their content can never change.
+
+The file is only read when ``PROJECTS_SCHEMA_FROM_ARTIFACT`` is on, as it
+is in the Docker image. Otherwise, or if the file is missing, the schema is
+generated in memory instead, so that it always matches the code in
+development and the service still works when the build step was skipped.
+Only the command writes the file.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.templatetags.static import static
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+from rest_framework import status
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE = 5 * 60
+VERSIONED_MAX_AGE = 365 * 24 * 60 * 60
+DOCS_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <title>Projects API</title>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+</head>
+<body>
+  <redoc spec-url="{schema_url}"></redoc>
+  <script src="{redoc_url}"></script>
+</body>
+</html>
+"""
+
+_lock = threading.Lock()
+_document = None  # pylint: disable=invalid-name
+
+
+def schema_path():
+    """
+    Return where the schema artifact is stored.
+    """
+    return Path(settings.PROJECTS_SCHEMA_PATH)
+
+
+def generate_schema():
+    """
+    Generate the OpenAPI schema of the service.
+
+    Returns:
+        bytes: The schema encoded as JSON
+    """
+    # pylint: disable=import-outside-toplevel
+    from drf_yasg import openapi
+    from drf_yasg.codecs import OpenAPICodecJson
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    generator = OpenAPISchemaGenerator(
+        openapi.Info(
+            title="Projects API",
+            default_version='v1',
+            description="API documentation for the Projects app",
+            contact=openapi.Contact(email="support@yourdomain.com"),
+            license=openapi.License(name="BSD License"),
+        )
+    )
+    return OpenAPICodecJson(validators=[]).encode(generator.get_schema(request=None, public=True))
+
+
+def write_schema(path=None):
+    """
+    Generate the schema and atomically replace the artifact with it.
+
+    Args:
+        path (Path | None): Where to write, ``PROJECTS_SCHEMA_PATH`` by default
+
+    Returns:
+        bytes: The schema encoded as JSON
+    """
+    path = Path(path or schema_path())
+    content = generate_schema()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as temporary:
+        temporary.write(content)
+    os.replace(temporary.name, path)
+    return content
+
+
+def load_schema():
+    """
+    Return the schema and its version, loading them only once.
+
+    Returns:
+        tuple[bytes, str]: The schema encoded as JSON and a hash of it
+    """
+    global _document  # pylint: disable=global-statement
+    with _lock:
+        if _document is None:
+            content = None
+            if settings.PROJECTS_SCHEMA_FROM_ARTIFACT:
+                try:
+                    content = schema_path().read_bytes()
+                except FileNotFoundError:
+                    logger.warning(
+                        "%s is missing; run build_openapi_schema. Generating the schema "
+                        "in memory instead.", schema_path(),
+                    )
+            if content is None:
+                content = generate_schema()
+            _document = (content, hashlib.sha256(content).hexdigest()[:16])
+        return _document
+
+
+def reset_schema():
+    """
+    Forget the loaded schema, so that it is read again on next use.
+    """
+    global _document  # pylint: disable=global-statement
+    with _lock:
+        _document = None  # pylint: disable=invalid-name
+
+
+@require_GET
+def openapi_schema(request):
+    """
+    The OpenAPI schema (GET /api/schema.json).
+
+    Query parameters:
+        v (str): Schema version; a current version makes the response
+                 cacheable for a year
+
+    Returns:
+        HttpResponse: The schema, or an empty 304 response if the client's
+                      copy is current
+    """
+    content, version = load_schema()
+    if request.GET.get("v") == version:
+        cache_control = f"public, max-age={VERSIONED_MAX_AGE}, immutable"
+    else:
+        cache_control = f"public, max-age={MAX_AGE}"
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("If-None-Match") == etag:
+        return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # The content is already encoded JSON.
+    return HttpResponse(  # pylint: disable=http-response-with-content-type-json
+        content, content_type="application/json", headers=headers
+    )
+
+
+@require_GET
+def api_docs(request):
+    """
+    ReDoc documentation page (GET /api/docs/), rendering the precomputed schema.
+    """
+    _, version = load_schema()
+    page = DOCS_TEMPLATE.format(
+        schema_url=f"{reverse('schema-json')}?v={version}",
+        redoc_url=static("drf-yasg/redoc/redoc.min.js"),
+    )
+    return HttpResponse(page, headers={"Cache-Control": f"public, max-age={MAX_AGE}"})
@@ -0,0 +1,160 @@
+"""
+Project Full-Text Search Module
+
+This module provides ranked full-text search over the name, location and
+description of projects. The index lives in the database and is maintained by
+the database itself, so every write path (API, admin, bulk updates, raw SQL)
+keeps it in sync:
+
+- SQLite: an FTS5 external-content table kept current by triggers.
+- PostgreSQL: a stored generated ``tsvector`` column with a GIN index.
+
+Other database vendors fall back to case-insensitive ``LIKE`` matching.
+
+The index is created by migration ``0002_project_search_index``.
+
+Note:
+    SQLite migrations that rebuild the ``projects_project`` table (e.g. most
+    ``AlterField`` operations) drop its triggers. Such migrations must create
+    them again afterwards, with their own copy of the SQL in ``0002``.
+"""
+import html
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+FTS_TABLE = "projects_project_fts"
+PROJECT_TABLE = "projects_project"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# The database marks matches with private-use characters, so that the
+# snippet can be HTML-escaped before the <mark> tags are inserted.
+MATCH_START = "\ue000"
+MATCH_END = "\ue001"
+MAX_TERMS = 16
+TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def parse_terms(query):
+    """
+    Split free text into search terms, discarding any query syntax.
+
+    Args:
+        query (str): Raw user input
+
+    Returns:
+        list[str]: At most ``MAX_TERMS`` word tokens
+    """
+    return TERM_PATTERN.findall(query or "")[:MAX_TERMS]
+
+
+def search_projects(queryset, query, highlight=True):
+    """
+    Filter and rank a Project queryset by a free-text query.
+
+    Every term must match (AND semantics) and the last term is also matched
+    as a prefix, so partially typed words find results. Matches in ``name``
+    rank above ``location``, which rank above ``description``.
+
+    Args:
+        queryset (QuerySet): Base Project queryset to search within
+        query (str): Raw user input
+        highlight (bool): Whether to annotate ``search_highlight`` snippets
+
+    Returns:
+        QuerySet: Matching projects ordered by relevance, annotated with
+                  ``search_rank`` (higher is better) and, if requested, a raw
+                  ``search_highlight`` to be passed to ``render_highlight``.
+    """
+    terms = parse_terms(query)
+    if not terms:
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, terms, highlight)
+    if vendor == "postgresql":
+        return _search_postgres(queryset, terms, highlight)
+    return _search_fallback(queryset, terms)
+
+
+def render_highlight(snippet):
+    """
+    Turn a raw database snippet into HTML with matches wrapped in <mark> tags.
+
+    The stored text is escaped, so project fields cannot inject markup.
+
+    Args:
+        snippet (str | None): A ``search_highlight`` annotation
+
+    Returns:
+        str | None: Escaped HTML, or None if there is no snippet
+    """
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(MATCH_START, HIGHLIGHT_START)
+        .replace(MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def _search_sqlite(queryset, terms, highlight):
+    """
+    Run a search against the SQLite FTS5 table.
+    """
+    match = " ".join(f'"{term}"' for term in terms[:-1])
+    match = f'{match} "{terms[-1]}"*'.strip()
+    select = {"search_rank": f"-bm25({FTS_TABLE}, 10.0, 5.0, 1.0)"}
+    select_params = []
+    if highlight:
+        select["search_highlight"] = f"snippet({FTS_TABLE}, -1, %s, %s, '…', 16)"
+        select_params = [MATCH_START, MATCH_END]
+    return queryset.extra(  # nosec - all user input is passed as parameters
+        tables=[FTS_TABLE],
+        where=[f"{FTS_TABLE}.rowid = {PROJECT_TABLE}.id", f"{FTS_TABLE} MATCH %s"],
+        params=[match],
+        select=select,
+        select_params=select_params,
+        order_by=["-search_rank"],
+    )
+
+
+def _search_postgres(queryset, terms, highlight):
+    """
+    Run a search against the PostgreSQL ``search_vector`` column.
+    """
+    tsquery = " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+    select = {
+        "search_rank": f"ts_rank_cd({PROJECT_TABLE}.search_vector, to_tsquery('simple', %s))",
+    }
+    select_params = [tsquery]
+    if highlight:
+        select["search_highlight"] = (
+            f"ts_headline('simple', concat_ws(' … ', {PROJECT_TABLE}.name, "
+            f"{PROJECT_TABLE}.location, {PROJECT_TABLE}.description), "
+            "to_tsquery('simple', %s), %s)"
+        )
+        select_params += [
+            tsquery, f"StartSel={MATCH_START}, StopSel={MATCH_END}, MaxFragments=2"
+        ]
+    return queryset.extra(  # nosec - all user input is passed as parameters
+        where=[f"{PROJECT_TABLE}.search_vector @@ to_tsquery('simple', %s)"],
+        params=[tsquery],
+        select=select,
+        select_params=select_params,
+        order_by=["-search_rank"],
+    )
+
+
+def _search_fallback(queryset, terms):
+    """
+    Match every term with ``icontains`` on databases without a full-text index.
+    """
+    for term in terms:
+        queryset = queryset.filter(
+            Q(name__icontains=term) | Q(location__icontains=term)
+            | Q(description__icontains=term)
+        )
+    return queryset
@@ -8,8 +8,11 @@ automatically converts addresses to geographic coordinates using Google Maps API
 
 from rest_framework import serializers
 
+from .changes import decode_cursor
+from .clusters import MAX_ZOOM
 from .google_maps import geocode_address
 from .models import Project
+from .search import render_highlight
 
 
 class ProjectSerializer(serializers.ModelSerializer):
@@ -98,3 +101,417 @@ class ProjectSerializer(serializers.ModelSerializer):
         validated_data["latitude"] = lat
         validated_data["longitude"] = lng
         return validated_data
+
+
+class ProjectSearchSerializer(ProjectSerializer):
+    """
+    Read-only serializer for full-text search results.
+
+    Extends ProjectSerializer with the relevance score and highlighted snippet
+    annotated by ``projects.search.search_projects``.
+
+    Attributes:
+        search_rank (FloatField): Relevance score, higher is better
+        search_highlight (SerializerMethodField): HTML-escaped matching text
+                                                  with terms wrapped in <mark> tags
+    """
+    search_rank = serializers.FloatField(read_only=True)
+    search_highlight = serializers.SerializerMethodField()
+
+    def get_search_highlight(self, obj):
+        """
+        Return the escaped highlight snippet of a search result.
+        """
+        return render_highlight(getattr(obj, "search_highlight", None))
+
+
+class BoundingBoxField(serializers.CharField):
+    """
+    A ``west,south,east,north`` bounding box in degrees.
+
+    A west edge east of the east edge denotes a box crossing the antimeridian.
+    Validated values are ``(west, south, east, north)`` tuples of floats.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Parse the bounding box into a tuple of floats.
+
+        Returns:
+            tuple[float, float, float, float]: ``(west, south, east, north)``
+
+        Raises:
+            serializers.ValidationError: If the box is malformed or out of range
+        """
+        value = super().to_internal_value(data)
+        try:
+            west, south, east, north = (float(part) for part in value.split(","))
+        except ValueError as e:
+            raise serializers.ValidationError(
+                "Expected four comma-separated numbers: west,south,east,north."
+            ) from e
+        if not (-180 <= west <= 180 and -180 <= east <= 180
+                and -90 <= south <= north <= 90):
+            raise serializers.ValidationError("Coordinates are out of range.")
+        return west, south, east, north
+
+
+class ClusterQuerySerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the query parameters of the clusters endpoint.
+
+    Attributes:
+        bbox (BoundingBoxField): The map viewport
+        zoom (IntegerField): Map zoom level; levels above the deepest grid
+                             level are served from that level
+    """
+    bbox = BoundingBoxField()
+    zoom = serializers.IntegerField(min_value=0, max_value=MAX_ZOOM + 8)
+
+
+class GeoJSONPolygonField(serializers.Field):
+    """
+    A GeoJSON ``Polygon`` or ``MultiPolygon`` geometry.
+
+    Validated values are tuples of polygons, each a tuple of closed rings,
+    each a tuple of ``(longitude, latitude)`` pairs, so that equal regions
+    compare and hash equal.
+    """
+    MAX_VERTICES = 100_000
+
+    default_error_messages = {
+        "invalid": "Expected a GeoJSON Polygon or MultiPolygon geometry.",
+        "ring": "Each linear ring must be a closed list of at least four positions.",
+        "position": "Each position must be a [longitude, latitude] pair within range.",
+        "too_large": f"The geometry may have at most {MAX_VERTICES} vertices.",
+    }
+
+    def to_internal_value(self, data):
+        """
+        Normalise the geometry into nested tuples of coordinates.
+
+        Returns:
+            tuple: The polygons of the geometry
+
+        Raises:
+            serializers.ValidationError: If the geometry is malformed
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("coordinates"), list):
+            self.fail("invalid")
+        polygons = {
+            "Polygon": [data["coordinates"]], "MultiPolygon": data["coordinates"],
+        }.get(data.get("type"))
+        if not polygons or not all(isinstance(rings, list) and rings for rings in polygons):
+            self.fail("invalid")
+
+        vertices = 0
+        result = []
+        for rings in polygons:
+            polygon = []
+            for ring in rings:
+                if not isinstance(ring, list) or len(ring) < 4:
+                    self.fail("ring")
+                vertices += len(ring)
+                if vertices > self.MAX_VERTICES:
+                    self.fail("too_large")
+                positions = tuple(self._position(position) for position in ring)
+                if positions[0] != positions[-1]:
+                    self.fail("ring")
+                polygon.append(positions)
+            result.append(tuple(polygon))
+        return tuple(result)
+
+    def _position(self, position):
+        """
+        Validate one GeoJSON position, ignoring any altitude.
+        """
+        if not isinstance(position, list) or len(position) < 2 or not all(
+                isinstance(part, (int, float)) and not isinstance(part, bool)
+                for part in position[:2]):
+            self.fail("position")
+        longitude, latitude = float(position[0]), float(position[1])
+        if not (-180 <= longitude <= 180 and -90 <= latitude <= 90):
+            self.fail("position")
+        return longitude, latitude
+
+    def to_representation(self, value):
+        """
+        Return the geometry as a GeoJSON ``MultiPolygon``.
+        """
+        return {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [[list(position) for position in ring] for ring in polygon] for polygon in value
+            ],
+        }
+
+
+class ProjectWithinQuerySerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the body of the geofence endpoint.
+
+    Attributes:
+        geometry (GeoJSONPolygonField): The region to search
+        cursor (CharField): Opaque cursor returned for the previous page;
+                            omitted for the first page
+        limit (IntegerField): Maximum number of projects per page
+    """
+    geometry = GeoJSONPolygonField()
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into the primary key to resume after.
+
+        Returns:
+            int: The last project primary key scanned for the previous page
+
+        Raises:
+            serializers.ValidationError: If the cursor is malformed
+        """
+        try:
+            return decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
+
+
+class RoutePointSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates a coordinate pair.
+
+    Attributes:
+        latitude (FloatField): Latitude in degrees
+        longitude (FloatField): Longitude in degrees
+    """
+    latitude = serializers.FloatField(min_value=-90, max_value=90)
+    longitude = serializers.FloatField(min_value=-180, max_value=180)
+
+
+class ProjectRouteSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the body of the route planning endpoint.
+
+    Attributes:
+        uuids (ListField): UUIDs of the projects to visit
+        start (RoutePointSerializer): Where the route starts; it starts at
+                                      one of the projects if omitted
+    """
+    MAX_STOPS = 2000
+
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(), min_length=1, max_length=MAX_STOPS
+    )
+    start = RoutePointSerializer(required=False)
+
+    def validate_uuids(self, value):
+        """
+        Reject repeated projects.
+
+        Raises:
+            serializers.ValidationError: If a UUID is listed twice
+        """
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("Each project may only be listed once.")
+        return value
+
+
+class ProjectBulkFilterSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the filter expression that selects projects for a bulk operation.
+
+    Only the lookups declared here are accepted; at least one must be given.
+    """
+    status = serializers.ChoiceField(choices=Project.STATUS_CHOICES, required=False)
+    status__in = serializers.ListField(
+        child=serializers.ChoiceField(choices=Project.STATUS_CHOICES), required=False
+    )
+    location = serializers.CharField(required=False)
+    start_date__gte = serializers.DateField(required=False)
+    start_date__lte = serializers.DateField(required=False)
+    end_date__gte = serializers.DateField(required=False)
+    end_date__lte = serializers.DateField(required=False)
+
+    def to_internal_value(self, data):
+        """
+        Reject lookups that are not declared on this serializer.
+
+        Raises:
+            serializers.ValidationError: If the filter has unknown keys
+        """
+        unknown = set(data) - set(self.fields) if isinstance(data, dict) else set()
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unsupported filter(s): {', '.join(sorted(unknown))}."
+            )
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        """
+        Reject empty filters.
+
+        Raises:
+            serializers.ValidationError: If the filter is empty
+        """
+        if not attrs:
+            raise serializers.ValidationError("The filter must contain at least one lookup.")
+        return attrs
+
+
+class ProjectBulkSelectionSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates which projects a bulk operation applies to.
+
+    Exactly one of ``uuids`` or ``filter`` must be given.
+
+    Attributes:
+        uuids (ListField): UUIDs of the projects to select
+        filter (ProjectBulkFilterSerializer): Lookups the projects must all match
+    """
+    MAX_UUIDS = 5000
+
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(), max_length=MAX_UUIDS, required=False
+    )
+    filter = ProjectBulkFilterSerializer(required=False)
+
+    def validate(self, attrs):
+        """
+        Require exactly one selection method.
+
+        Raises:
+            serializers.ValidationError: If both or neither are given
+        """
+        if ("uuids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError("Provide exactly one of 'uuids' or 'filter'.")
+        return attrs
+
+    def selected_projects(self):
+        """
+        Return the projects selected by the validated data.
+
+        Returns:
+            QuerySet: The selected projects
+        """
+        if "uuids" in self.validated_data:
+            return Project.objects.filter(uuid__in=self.validated_data["uuids"])
+        return Project.objects.filter(**self.validated_data["filter"])
+
+
+class ProjectBulkValuesSerializer(ProjectSerializer):
+    """
+    Validates the field values applied by a bulk update.
+
+    Unique and derived fields (``name``, ``uuid``, coordinates) cannot be set
+    in bulk. Every field is optional, but at least one must be given.
+    """
+
+    class Meta:
+        """
+        Metadata options for the ProjectBulkValuesSerializer.
+
+        Attributes:
+            model (Model): The Django model that this serializer is based on.
+            fields (tuple): The fields that can be updated in bulk.
+            extra_kwargs (dict): Makes every field optional.
+        """
+        model = Project
+        fields = ("description", "start_date", "end_date", "status", "location")
+        extra_kwargs = {field: {"required": False} for field in fields}
+
+    def validate(self, attrs):
+        """
+        Require at least one value.
+
+        Raises:
+            serializers.ValidationError: If no values are given
+        """
+        if not attrs:
+            raise serializers.ValidationError("Provide at least one field to update.")
+        return attrs
+
+    def geocode(self, values):
+        """
+        Add the coordinates of ``values["location"]`` to the values.
+
+        Args:
+            values (dict): Validated bulk values including a location
+
+        Returns:
+            dict: The values with latitude and longitude added
+
+        Raises:
+            serializers.ValidationError: If the location cannot be geocoded
+        """
+        return self._add_coordinates(dict(values))
+
+
+class ProjectBulkUpdateSerializer(ProjectBulkSelectionSerializer):  # pylint: disable=abstract-method
+    """
+    Validates a bulk update: a project selection plus the values to apply.
+
+    Attributes:
+        values (ProjectBulkValuesSerializer): The field values to apply
+    """
+    values = ProjectBulkValuesSerializer()
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the query parameters of the change feed endpoint.
+
+    Attributes:
+        cursor (CharField): Opaque cursor returned by a previous feed call;
+                            omitted to start following the feed from now
+        limit (IntegerField): Maximum number of changes to read
+    """
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=1000, default=100)
+
+    def validate_cursor(self, value):
+        """
+        Decode the cursor into a change sequence number.
+
+        Returns:
+            int: The sequence number of the last change the client has seen
+
+        Raises:
+            serializers.ValidationError: If the cursor is malformed
+        """
+        try:
+            return decode_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
+
+
+class ProjectEventFilterSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Validates the filters and resume position of the project event stream.
+
+    Attributes:
+        status (CharField): Comma-separated statuses to receive events for
+        bbox (BoundingBoxField): Area to receive events for
+        last_event_id (IntegerField): Resume after this event, for clients
+                                      that cannot send a Last-Event-ID header
+    """
+    status = serializers.CharField(required=False)
+    bbox = BoundingBoxField(required=False)
+    last_event_id = serializers.IntegerField(min_value=0, required=False)
+
+    def validate_status(self, value):
+        """
+        Split and check the requested statuses.
+
+        Returns:
+            frozenset[str]: The requested statuses
+
+        Raises:
+            serializers.ValidationError: If a status is unknown
+        """
+        statuses = frozenset(part.strip() for part in value.split(",") if part.strip())
+        unknown = statuses - {choice for choice, _ in Project.STATUS_CHOICES}
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown status(es): {', '.join(sorted(unknown))}."
+            )
+        return statuses
@@ -0,0 +1,102 @@
+"""
+Project Change Signals
+
+This module funnels every write to the Project table into a single signal,
+``projects_changed``, so derived data (statistics, indexes, caches) can be
+maintained incrementally from one place.
+
+Each change is a ``(before, after)`` pair of row snapshots holding the fields
+in ``SNAPSHOT_FIELDS``: ``before`` is None for inserts and ``after`` is None for
+deletes. Single-object saves and deletes are translated from Django's model
+signals here; set-based writes in ``projects.bulk`` send the signal themselves.
+"""
+from decimal import Context, Decimal
+
+from django.db import models
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from .models import Project
+
+# Sent with ``changes``: a list of ``(before, after)`` snapshot pairs.
+projects_changed = Signal()
+
+SNAPSHOT_FIELDS = ("id", "uuid", "status", "start_date", "latitude", "longitude")
+
+
+def stored_value(field, value):
+    """
+    Return a field value as the database stores it.
+
+    Decimal fields are rounded to their ``decimal_places``, as Django does
+    when saving, so that snapshots of unsaved floats such as geocoded
+    coordinates match the snapshots later read back from the database.
+
+    Args:
+        field (Field): The model field
+        value: The in-memory value
+
+    Returns:
+        The value as stored
+    """
+    if value is None or not isinstance(field, models.DecimalField):
+        return value
+    return field.to_python(value).quantize(
+        Decimal(1).scaleb(-field.decimal_places), context=Context(prec=field.max_digits)
+    )
+
+
+def snapshot(instance):
+    """
+    Capture the tracked fields of a Project instance, as stored.
+
+    Args:
+        instance (Project): The project to snapshot
+
+    Returns:
+        dict: Field name to value for every field in ``SNAPSHOT_FIELDS``
+    """
+    return {
+        field: stored_value(Project._meta.get_field(field), getattr(instance, field))
+        for field in SNAPSHOT_FIELDS
+    }
+
+
+def send_changes(changes):
+    """
+    Announce a batch of project changes to all receivers.
+
+    Args:
+        changes (list[tuple[dict | None, dict | None]]): ``(before, after)`` pairs
+    """
+    if changes:
+        projects_changed.send(sender=Project, changes=changes)
+
+
+# pylint: disable=unused-argument
+@receiver(pre_save, sender=Project)
+def capture_previous_state(sender, instance, **kwargs):
+    """
+    Remember the stored state of a project that is about to be updated.
+    """
+    if instance.pk is not None:
+        instance._previous_snapshot = (  # pylint: disable=protected-access
+            Project.objects.filter(pk=instance.pk).values(*SNAPSHOT_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Project)
+def announce_save(sender, instance, created, **kwargs):
+    """
+    Send ``projects_changed`` for a project that was inserted or updated.
+    """
+    before = None if created else instance.__dict__.pop("_previous_snapshot", None)
+    send_changes([(before, snapshot(instance))])
+
+
+@receiver(post_delete, sender=Project)
+def announce_delete(sender, instance, **kwargs):
+    """
+    Send ``projects_changed`` for a project that was deleted.
+    """
+    send_changes([(snapshot(instance), None)])
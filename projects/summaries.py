@@ -0,0 +1,189 @@
+"""
+Incrementally Maintained Project Statistics
+
+This module keeps the ``ProjectStatistic`` summary table in step with the
+Project table. Every write announced through ``projects_changed`` is turned
+into per-group count deltas, so reading statistics costs the same no matter
+how many projects exist.
+
+Projects are grouped by:
+- status
+- start month (``YYYY-MM``)
+- geographic cell: ``CELL_SIZE_DEGREES`` squares keyed ``"<lat>,<lng>"`` by
+  their south-west corner, or ``UNLOCATED_CELL`` for projects without
+  coordinates
+"""
+import math
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Floor, TruncMonth
+from django.dispatch import receiver
+
+from .models import Project, ProjectStatistic
+from .signals import projects_changed
+
+CELL_SIZE_DEGREES = 1
+UNLOCATED_CELL = "unlocated"
+
+
+def cell_key(latitude, longitude):
+    """
+    Return the geographic cell key for a coordinate pair.
+
+    Args:
+        latitude (Decimal | float | None): Latitude in degrees
+        longitude (Decimal | float | None): Longitude in degrees
+
+    Returns:
+        str: ``"<lat>,<lng>"`` of the cell's south-west corner, or
+             ``UNLOCATED_CELL`` if either coordinate is missing
+    """
+    if latitude is None or longitude is None:
+        return UNLOCATED_CELL
+    lat = math.floor(float(latitude) / CELL_SIZE_DEGREES) * CELL_SIZE_DEGREES
+    lng = math.floor(float(longitude) / CELL_SIZE_DEGREES) * CELL_SIZE_DEGREES
+    return f"{lat},{lng}"
+
+
+def statistic_keys(row):
+    """
+    Return the ``(dimension, key)`` groups a project snapshot belongs to.
+
+    Args:
+        row (dict): A project snapshot (see ``projects.signals.SNAPSHOT_FIELDS``)
+
+    Returns:
+        list[tuple[str, str]]: One group per dimension
+    """
+    return [
+        ("status", row["status"]),
+        ("start_month", str(row["start_date"])[:7]),
+        ("cell", cell_key(row["latitude"], row["longitude"])),
+    ]
+
+
+def apply_deltas(deltas, using="default"):
+    """
+    Add count deltas to the summary table, creating missing groups.
+
+    Args:
+        deltas (Counter): ``(dimension, key)`` to count delta
+        using (str): Database alias to write to
+    """
+    statistics = ProjectStatistic.objects.using(using)
+    for (dimension, key), delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        group = statistics.filter(dimension=dimension, key=key)
+        if group.update(count=F("count") + delta):
+            continue
+        try:
+            with transaction.atomic(using=using):
+                statistics.create(dimension=dimension, key=key, count=delta)
+        except IntegrityError:
+            group.update(count=F("count") + delta)
+
+
+# pylint: disable=unused-argument
+@receiver(projects_changed)
+def update_statistics(sender, changes, **kwargs):
+    """
+    Translate project changes into summary count deltas.
+    """
+    deltas = Counter()
+    for before, after in changes:
+        if before is not None:
+            deltas.subtract(statistic_keys(before))
+        if after is not None:
+            deltas.update(statistic_keys(after))
+    apply_deltas(deltas)
+
+
+def compute_statistics(project_queryset):
+    """
+    Aggregate group counts directly from the Project table.
+
+    Args:
+        project_queryset (QuerySet): The projects to aggregate
+
+    Returns:
+        Counter: ``(dimension, key)`` to project count
+    """
+    counts = Counter()
+    for row in project_queryset.values("status").annotate(n=Count("pk")).order_by():
+        counts["status", row["status"]] += row["n"]
+
+    by_month = (
+        project_queryset.annotate(month=TruncMonth("start_date"))
+        .values("month").annotate(n=Count("pk")).order_by()
+    )
+    for row in by_month:
+        counts["start_month", str(row["month"])[:7]] += row["n"]
+
+    by_cell = (
+        project_queryset
+        .annotate(
+            lat_cell=Floor(F("latitude") / CELL_SIZE_DEGREES),
+            lng_cell=Floor(F("longitude") / CELL_SIZE_DEGREES),
+        )
+        .values("lat_cell", "lng_cell").annotate(n=Count("pk")).order_by()
+    )
+    for row in by_cell:
+        if row["lat_cell"] is None or row["lng_cell"] is None:
+            key = UNLOCATED_CELL
+        else:
+            key = cell_key(
+                int(row["lat_cell"]) * CELL_SIZE_DEGREES,
+                int(row["lng_cell"]) * CELL_SIZE_DEGREES,
+            )
+        counts["cell", key] += row["n"]
+    return counts
+
+
+def reconcile_statistics():
+    """
+    Rebuild the summary table from the Project table.
+
+    Returns:
+        int: Number of groups whose stored count was wrong or missing
+    """
+    with transaction.atomic():
+        expected = compute_statistics(Project.objects.all())
+        stored = {
+            (row.dimension, row.key): row
+            for row in ProjectStatistic.objects.select_for_update()
+        }
+        drifted = 0
+        stale = [row.pk for group, row in stored.items() if group not in expected]
+        drifted += ProjectStatistic.objects.filter(pk__in=stale).exclude(count=0).count()
+        ProjectStatistic.objects.filter(pk__in=stale).delete()
+        for (dimension, key), count in expected.items():
+            row = stored.get((dimension, key))
+            if row is None:
+                ProjectStatistic.objects.create(dimension=dimension, key=key, count=count)
+                drifted += 1
+            elif row.count != count:
+                row.count = count
+                row.save(update_fields=["count"])
+                drifted += 1
+    return drifted
+
+
+def read_statistics():
+    """
+    Return project counts by status, start month and geographic cell.
+
+    Returns:
+        dict: ``total`` plus one mapping of group key to count per dimension
+    """
+    result = {"by_status": {}, "by_start_month": {}, "by_cell": {}}
+    groups = ProjectStatistic.objects.filter(count__gt=0).order_by("dimension", "key")
+    for dimension, key, count in groups.values_list("dimension", "key", "count"):
+        result[f"by_{dimension}"][key] = count
+    return {
+        "total": sum(result["by_status"].values()),
+        "cell_size_degrees": CELL_SIZE_DEGREES,
+        **result,
+    }
@@ -0,0 +1,139 @@
+"""
+Background Tasks for the Projects App
+
+This module runs slow work, such as geocoding many projects, outside of the
+request/response cycle. Work is handed to a small in-process thread pool once
+the surrounding transaction commits, so no external broker is required.
+
+Setting ``PROJECTS_TASKS_EAGER = True`` runs tasks synchronously, which is
+useful in tests.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from django.db import connections, transaction
+
+from .bulk import update_projects
+from .google_maps import geocode_address
+from .models import Project
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_BATCH_SIZE = 500
+STATUS_BATCH_SIZE = 500
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="projects-tasks")
+
+
+def _run_and_close(func, *args):
+    """
+    Run a task in a worker thread and release its database connections.
+    """
+    try:
+        func(*args)
+    except Exception:  # pylint: disable=broad-exception-caught
+        logger.exception("Background task %s failed", func.__name__)
+    finally:
+        connections.close_all()
+
+
+def run_in_background(func, *args):
+    """
+    Schedule ``func(*args)`` to run after the current transaction commits.
+
+    Args:
+        func (callable): The task to run
+        *args: Positional arguments passed to the task
+    """
+    if getattr(settings, "PROJECTS_TASKS_EAGER", False):
+        transaction.on_commit(lambda: func(*args))
+    else:
+        transaction.on_commit(lambda: _executor.submit(_run_and_close, func, *args))
+
+
+def geocode_projects(project_ids):
+    """
+    Geocode the given projects and store their coordinates.
+
+    Each distinct location is sent to Google Maps once, and all projects that
+    share it are updated with a single set-based UPDATE.
+
+    Args:
+        project_ids (Iterable[int]): Primary keys of the projects to geocode
+
+    Returns:
+        int: Number of projects whose coordinates were updated
+    """
+    project_ids = list(project_ids)
+    resolved = {}
+    updated = 0
+    for start in range(0, len(project_ids), GEOCODE_BATCH_SIZE):
+        batch = project_ids[start:start + GEOCODE_BATCH_SIZE]
+        locations = (
+            Project.objects.filter(pk__in=batch)
+            .values_list("location", flat=True).distinct()
+        )
+        for location in locations:
+            if location not in resolved:
+                try:
+                    resolved[location] = geocode_address(location)
+                except (ValueError, requests.exceptions.RequestException) as e:
+                    logger.warning("Could not geocode %r: %s", location, e)
+                    resolved[location] = None
+            if resolved[location] is None:
+                continue
+            lat, lng = resolved[location]
+            updated += update_projects(
+                Project.objects.filter(pk__in=batch, location=location),
+                latitude=lat, longitude=lng,
+            )
+    return updated
+
+
+def set_projects_status(queryset, status):
+    """
+    Set the status of every project in a queryset, a batch at a time.
+
+    Each batch of ``STATUS_BATCH_SIZE`` projects is updated in its own
+    transaction, so large selections neither hold locks on every row at once
+    nor keep all of them in memory.
+
+    Args:
+        queryset (QuerySet): The projects to update
+        status (str): The new status
+
+    Returns:
+        int: Number of projects updated
+    """
+    selection = queryset.order_by("pk").values_list("pk", flat=True)
+    updated = 0
+    last_pk = 0
+    while True:
+        batch = list(selection.filter(pk__gt=last_pk)[:STATUS_BATCH_SIZE])
+        if not batch:
+            return updated
+        updated += update_projects(Project.objects.filter(pk__in=batch), status=status)
+        last_pk = batch[-1]
+
+
+def enqueue_status_update(queryset, status):
+    """
+    Set the status of the projects in a queryset in the background.
+
+    Args:
+        queryset (QuerySet): The projects to update, evaluated when the task runs
+        status (str): The new status
+    """
+    run_in_background(set_projects_status, queryset.all(), status)
+
+
+def enqueue_geocoding(project_ids):
+    """
+    Geocode the given projects in the background.
+
+    Args:
+        project_ids (Iterable[int]): Primary keys of the projects to geocode
+    """
+    run_in_background(geocode_projects, list(project_ids))
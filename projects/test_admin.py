@@ -0,0 +1,149 @@
+"""
+Project Admin Test Module
+
+This module contains tests for the Project admin changelist, its bulk actions
+and the estimated-count paginator used to keep it fast on large tables.
+"""
+
+import datetime
+from unittest.mock import patch, Mock
+from django.contrib.auth import get_user_model
+from django.core.paginator import EmptyPage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from projects.models import Project
+from projects.pagination import EstimatedCountPaginator
+from projects.summaries import read_statistics
+
+
+@override_settings(PROJECTS_TASKS_EAGER=True)
+class ProjectAdminTests(TestCase):
+    """
+    Test case for the Project admin.
+
+    Tests include:
+    - Changelist rendering with truncated descriptions and full-text search
+    - Set-based status change actions, in the background for large selections
+    - Background re-geocoding action
+    - Estimated counts for large result sets
+    """
+
+    def setUp(self):
+        """
+        Log in as a superuser and create sample projects.
+        """
+        user = get_user_model().objects.create_superuser("admin", "admin@example.com", "password")
+        self.client.force_login(user)
+        self.changelist_url = reverse("admin:projects_project_changelist")
+        self.projects = [
+            Project.objects.create(
+                name=f"Project {i}",
+                description="x" * 200,
+                start_date=datetime.date(2025, 1, i + 1),
+                status="pending",
+                location="Campinas, SP" if i % 2 else "Sao Paulo, SP",
+            )
+            for i in range(4)
+        ]
+
+    def test_changelist_truncates_description(self):
+        """
+        Verify the changelist renders a preview instead of the full description.
+        """
+        response = self.client.get(self.changelist_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "x" * 80 + "…")
+        self.assertNotContains(response, "x" * 81)
+
+    def test_changelist_search(self):
+        """
+        Verify the admin search goes through the full-text index.
+        """
+        response = self.client.get(self.changelist_url, {"q": "campin"})
+        self.assertContains(response, "Project 1")
+        self.assertNotContains(response, "Project 0")
+
+    def test_status_action(self):
+        """
+        Verify the status action updates every selected project.
+        """
+        selected = [str(p.pk) for p in self.projects[:3]]
+        response = self.client.post(self.changelist_url, {
+            "action": "mark_completed", "_selected_action": selected,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Project.objects.filter(status="completed").count(), 3)
+
+    @patch("projects.admin.BACKGROUND_ACTION_THRESHOLD", 2)
+    @patch("projects.tasks.STATUS_BATCH_SIZE", 2)
+    def test_status_action_in_background(self):
+        """
+        Verify large selections are updated by a background task in batches.
+        """
+        selected = [str(p.pk) for p in self.projects[:3]]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.changelist_url, {
+                "action": "mark_completed", "_selected_action": selected,
+            }, follow=True)
+        self.assertContains(response, "marked as Completed in the background")
+        self.assertEqual(Project.objects.filter(status="completed").count(), 3)
+        self.assertEqual(read_statistics()["by_status"]["completed"], 3)
+
+    @patch("projects.google_maps.requests.get")
+    def test_regeocode_action(self, mock_requests_get):
+        """
+        Verify re-geocoding calls Google once per distinct location.
+        """
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "status": "OK",
+            "results": [{"geometry": {"location": {"lat": -22.9, "lng": -47.06}}}],
+        }
+        mock_requests_get.return_value = mock_response
+
+        selected = [str(p.pk) for p in self.projects]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.changelist_url, {
+                "action": "regeocode_selected", "_selected_action": selected,
+            })
+
+        self.assertEqual(mock_requests_get.call_count, 2)
+        self.assertEqual(Project.objects.filter(latitude__isnull=True).count(), 0)
+
+    def test_estimated_count_paginator(self):
+        """
+        Verify small result sets are counted exactly and large ones estimated.
+        """
+        paginator = EstimatedCountPaginator(Project.objects.order_by("pk"), 2)
+        self.assertEqual(paginator.count, 4)
+
+        paginator = EstimatedCountPaginator(Project.objects.order_by("pk"), 2)
+        paginator.exact_count_limit = 2
+        Project.objects.filter(pk=self.projects[0].pk).delete()
+        self.assertEqual(paginator.count, self.projects[-1].pk)
+
+    def test_estimated_count_of_filtered_changelist(self):
+        """
+        Verify large filtered result sets are estimated rather than capped.
+        """
+        Project.objects.bulk_create(
+            Project(
+                name=f"Bulk {i}", start_date=datetime.date(2025, 1, 1),
+                status="completed" if i % 4 == 0 else "pending", location="Campinas, SP",
+            )
+            for i in range(2000)
+        )
+        paginator = EstimatedCountPaginator(Project.objects.filter(status="completed"), 10)
+        paginator.exact_count_limit = 100
+        # 500 rows match; a sample estimate is close, the counted bound is 101.
+        self.assertAlmostEqual(paginator.count, 500, delta=150)
+        self.assertEqual(len(paginator.page(50).object_list), 10)
+        with self.assertRaises(EmptyPage):
+            paginator.page(51)
+
+        with patch.object(EstimatedCountPaginator, "exact_count_limit", 100):
+            response = self.client.get(
+                self.changelist_url, {"status__exact": "completed", "p": 5}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Bulk 0<")  # the oldest, shown last
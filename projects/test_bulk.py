@@ -0,0 +1,143 @@
+"""
+Project Bulk Endpoint Test Module
+
+This module contains tests for the set-based PATCH and DELETE
+/api/projects/bulk/ endpoints.
+"""
+
+import datetime
+from unittest.mock import patch, Mock
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.checks import check_project_has_no_reverse_relations
+from projects.models import Project
+from projects.summaries import read_statistics
+
+
+class ProjectBulkTests(APITestCase):
+    """
+    Test case for bulk project updates and deletes.
+
+    Tests include:
+    - Selecting projects by UUID and by filter
+    - Validation of selections and values
+    - Geocoding only projects whose location changes, once per request
+    - Derived data staying consistent
+    - The system check guarding raw deletes
+    """
+
+    def setUp(self):
+        """
+        Create three in-progress projects, one already at the target location.
+        """
+        self.projects = [
+            Project.objects.create(
+                name=f"Project {i}", start_date=datetime.date(2025, 1, 1),
+                status="in_progress",
+                location="Campinas, SP" if i == 0 else f"Street {i}",
+                latitude=-22.9, longitude=-47.06,
+            )
+            for i in range(3)
+        ]
+        Project.objects.create(
+            name="Other", start_date=datetime.date(2025, 6, 1), status="pending",
+            location="Elsewhere",
+        )
+        self.url = reverse("project-bulk")
+
+    def test_bulk_update_by_filter(self):
+        """
+        Verify a filter selects projects and the summary follows the update.
+        """
+        response = self.client.patch(self.url, {
+            "filter": {"status": "in_progress", "start_date__lte": "2025-03-01"},
+            "values": {"status": "completed"},
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertEqual(read_statistics()["by_status"], {"completed": 3, "pending": 1})
+
+    @patch("projects.google_maps.requests.get")
+    def test_bulk_update_location_geocodes_once(self, mock_requests_get):
+        """
+        Verify one geocode call serves every project that actually moves.
+        """
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "status": "OK",
+            "results": [{"geometry": {"location": {"lat": -23.0, "lng": -47.0}}}],
+        }
+        mock_requests_get.return_value = mock_response
+
+        response = self.client.patch(self.url, {
+            "uuids": [str(p.uuid) for p in self.projects],
+            "values": {"location": "Campinas, SP", "description": "Moved"},
+        }, format="json")
+
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertEqual(mock_requests_get.call_count, 1)
+        self.assertEqual(Project.objects.filter(description="Moved").count(), 3)
+        self.assertEqual(Project.objects.filter(latitude=-23).count(), 2)
+        self.assertEqual(float(Project.objects.get(pk=self.projects[0].pk).latitude), -22.9)
+
+    @patch("projects.google_maps.requests.get")
+    def test_bulk_update_without_moves_skips_geocoding(self, mock_requests_get):
+        """
+        Verify no geocode call is made when no location changes.
+        """
+        response = self.client.patch(self.url, {
+            "uuids": [str(self.projects[0].uuid)],
+            "values": {"location": "Campinas, SP"},
+        }, format="json")
+
+        self.assertEqual(response.data, {"updated": 1})
+        mock_requests_get.assert_not_called()
+
+    def test_bulk_update_validation(self):
+        """
+        Verify invalid selections and values are rejected before any write.
+        """
+        invalid = [
+            {"values": {"status": "completed"}},
+            {"uuids": [], "filter": {"status": "pending"}, "values": {"status": "completed"}},
+            {"filter": {}, "values": {"status": "completed"}},
+            {"filter": {"name__contains": "x"}, "values": {"status": "completed"}},
+            {"filter": {"status": "pending"}, "values": {}},
+            {"filter": {"status": "pending"}, "values": {"status": "unknown"}},
+        ]
+        for body in invalid:
+            response = self.client.patch(self.url, body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, body)
+        self.assertFalse(Project.objects.filter(status="completed").exists())
+
+    def test_bulk_delete(self):
+        """
+        Verify bulk deletes by UUID and by filter.
+        """
+        response = self.client.delete(
+            self.url, {"uuids": [str(self.projects[0].uuid)]}, format="json"
+        )
+        self.assertEqual(response.data, {"deleted": 1})
+
+        response = self.client.delete(
+            self.url, {"filter": {"status__in": ["in_progress"]}}, format="json"
+        )
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertEqual(Project.objects.count(), 1)
+        self.assertEqual(read_statistics()["total"], 1)
+
+    def test_raw_delete_guard(self):
+        """
+        Verify the system check fails once a model relates to Project.
+        """
+        self.assertEqual(check_project_has_no_reverse_relations(None), [])
+
+        relation = Mock()
+        relation.related_model._meta.label = "projects.Note"
+        relation.field.name = "project"
+        with patch.object(Project._meta, "related_objects", [relation]):
+            errors = check_project_has_no_reverse_relations(None)
+        self.assertEqual([error.id for error in errors], ["projects.E001"])
+        self.assertIn("projects.Note.project", errors[0].msg)
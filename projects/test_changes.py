@@ -0,0 +1,139 @@
+"""
+Project Change Feed Test Module
+
+This module contains tests for the project change log and the
+/api/projects/changes/ incremental sync endpoint.
+"""
+
+import datetime
+from io import StringIO
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.bulk import update_projects
+from projects.changes import decode_cursor, encode_cursor
+from projects.models import Project, ProjectChange
+
+
+class ProjectChangeFeedTests(APITestCase):
+    """
+    Test case for the change feed.
+
+    Tests include:
+    - Cursor encoding
+    - Following creates, updates and deletes from a cursor
+    - Paging through the feed
+    - Holding back changes after gaps that may still be filled
+    - Pruning and cursor expiry
+    """
+
+    def setUp(self):
+        """
+        Create a project and remember the feed head.
+        """
+        self.url = reverse("project-changes")
+        self.project = Project.objects.create(
+            name="Tracked", start_date=datetime.date(2025, 1, 1), status="pending",
+            location="Campinas",
+        )
+        self.cursor = self.client.get(self.url).data["cursor"]
+
+    def _follow(self, cursor, **params):
+        """
+        Read the feed from a cursor and return the response data.
+        """
+        response = self.client.get(self.url, {"cursor": cursor, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_cursor_round_trip(self):
+        """
+        Verify cursors decode to their sequence number and reject garbage.
+        """
+        self.assertEqual(decode_cursor(encode_cursor(1234)), 1234)
+        for bad in ("", "!!!", "MjpmMDA"):
+            with self.assertRaises(ValueError):
+                decode_cursor(bad)
+        response = self.client.get(self.url, {"cursor": "!!!"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_feed_reports_changes_since_cursor(self):
+        """
+        Verify creates, updates and deletes after the cursor are returned.
+        """
+        other = Project.objects.create(
+            name="New", start_date=datetime.date(2025, 1, 1), status="pending", location="X",
+        )
+        update_projects(Project.objects.filter(pk=self.project.pk), status="completed")
+        update_projects(Project.objects.filter(pk=self.project.pk), description="Twice")
+        other_uuid = other.uuid
+        other.delete()
+
+        data = self._follow(self.cursor)
+        summary = [(c["operation"], c["uuid"]) for c in data["changes"]]
+        self.assertEqual(summary, [
+            ("updated", str(self.project.uuid)), ("deleted", str(other_uuid)),
+        ])
+        self.assertEqual(data["changes"][0]["project"]["description"], "Twice")
+        self.assertIsNone(data["changes"][1]["project"])
+        self.assertEqual(self._follow(data["cursor"])["changes"], [])
+
+    def test_feed_waits_at_recent_gaps(self):
+        """
+        Verify readers do not pass a gap that an uncommitted change may fill.
+        """
+        for i in range(2):
+            update_projects(Project.objects.filter(pk=self.project.pk), description=str(i))
+        # Simulate the first change still being committed by another transaction.
+        first, second = ProjectChange.objects.order_by("seq")[1:3]
+        first.delete()
+
+        data = self._follow(self.cursor)
+        self.assertEqual((data["changes"], data["cursor"]), ([], self.cursor))
+        self.assertEqual(self.client.get(self.url).data["cursor"], self.cursor)
+
+        # A gap that old can only be a rolled-back change.
+        ProjectChange.objects.filter(pk=second.pk).update(
+            changed_at=timezone.now() - datetime.timedelta(seconds=10)
+        )
+        data = self._follow(self.cursor)
+        self.assertEqual([change["seq"] for change in data["changes"]], [second.seq])
+        self.assertEqual(data["cursor"], encode_cursor(second.seq))
+        self.assertEqual(self.client.get(self.url).data["cursor"], data["cursor"])
+
+    def test_feed_paging(self):
+        """
+        Verify the limit pages through the feed without losing changes.
+        """
+        for i in range(3):
+            update_projects(Project.objects.filter(pk=self.project.pk), description=str(i))
+
+        first = self._follow(self.cursor, limit=2)
+        self.assertTrue(first["has_more"])
+        second = self._follow(first["cursor"], limit=2)
+        self.assertFalse(second["has_more"])
+        self.assertEqual(second["changes"][0]["project"]["description"], "2")
+
+    @override_settings(PROJECTS_CHANGE_RETENTION_DAYS=7)
+    def test_pruning_expires_old_cursors(self):
+        """
+        Verify pruning keeps the newest entry and expires older cursors.
+        """
+        old_cursor = encode_cursor(0)
+        for i in range(2):
+            update_projects(Project.objects.filter(pk=self.project.pk), description=str(i))
+        ProjectChange.objects.update(changed_at=timezone.now() - datetime.timedelta(days=8))
+
+        out = StringIO()
+        call_command("prune_project_changes", stdout=out)
+        self.assertIn("Pruned 2 change(s)", out.getvalue())
+        self.assertEqual(ProjectChange.objects.count(), 1)
+
+        response = self.client.get(self.url, {"cursor": old_cursor})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertTrue(response.data["resync"])
+        head = self.client.get(self.url).data["cursor"]
+        self.assertEqual(self._follow(head)["changes"], [])
@@ -0,0 +1,108 @@
+"""
+Project Clustering Test Module
+
+This module contains tests for the hierarchical cluster grid and the
+/api/projects/clusters/ endpoint.
+"""
+
+import datetime
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.bulk import update_projects
+from projects.clusters import cell_bounds, cell_for, cell_ranges, rebuild_clusters
+from projects.models import Project, ProjectCluster
+
+
+class ProjectClusterTests(APITestCase):
+    """
+    Test case for map clustering.
+
+    Tests include:
+    - Grid cell arithmetic, including antimeridian-crossing boxes
+    - Incremental grid maintenance compared with a full rebuild
+    - Cluster centroids, counts and representatives from the endpoint
+    - Conditional requests and parameter validation
+    """
+
+    def setUp(self):
+        """
+        Create two projects in Campinas and one in Lisbon.
+        """
+        self.campinas = [
+            Project.objects.create(
+                name=f"Campinas {i}", start_date=datetime.date(2025, 1, 1),
+                status="pending", location="Campinas, SP",
+                latitude=-22.90 + i / 100, longitude=-47.06,
+            )
+            for i in range(2)
+        ]
+        self.lisbon = Project.objects.create(
+            name="Lisbon", start_date=datetime.date(2025, 1, 1), status="pending",
+            location="Lisbon", latitude=38.72, longitude=-9.14,
+        )
+        self.url = reverse("project-clusters")
+
+    def _grid(self):
+        """
+        Return the non-empty cluster cells as comparable tuples.
+        """
+        return {
+            (c.zoom, c.cell_x, c.cell_y): (c.count, round(c.latitude_sum, 6),
+                                           round(c.longitude_sum, 6))
+            for c in ProjectCluster.objects.filter(count__gt=0)
+        }
+
+    def test_cell_arithmetic(self):
+        """
+        Verify cells, their bounds and antimeridian ranges.
+        """
+        self.assertEqual(cell_for(0, 0, 0), (4, 4))
+        self.assertEqual(cell_for(90, -180, 0), (0, 0))
+        west, south, east, north = cell_bounds(2, *cell_for(-22.9, -47.06, 2))
+        self.assertTrue(west <= -47.06 < east and south <= -22.9 < north)
+        self.assertEqual(len(cell_ranges((170, -10, -170, 10), 3)), 2)
+        with self.assertRaises(ValueError):
+            cell_ranges((-180, -85, 180, 85), 16)
+
+    def test_grid_follows_writes(self):
+        """
+        Verify incremental maintenance matches a rebuild from scratch.
+        """
+        self.lisbon.latitude, self.lisbon.longitude = 41.15, -8.61
+        self.lisbon.save()
+        update_projects(Project.objects.filter(pk=self.campinas[0].pk), latitude=None)
+        self.campinas[1].delete()
+
+        incremental = self._grid()
+        rebuild_clusters()
+        self.assertEqual(incremental, self._grid())
+
+    def test_clusters_endpoint(self):
+        """
+        Verify clusters at a low zoom level with representative projects.
+        """
+        response = self.client.get(self.url, {"bbox": "-180,-85,180,85", "zoom": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        clusters = sorted(response.data["clusters"], key=lambda c: c["latitude"])
+        self.assertEqual([c["count"] for c in clusters], [2, 1])
+        self.assertAlmostEqual(clusters[0]["latitude"], -22.895)
+        self.assertEqual(
+            sorted(clusters[0]["project_uuids"]), sorted(str(p.uuid) for p in self.campinas)
+        )
+        self.assertIn("public", response["Cache-Control"])
+
+        cached = self.client.get(
+            self.url, {"bbox": "-180,-85,180,85", "zoom": 2},
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_clusters_endpoint_validation(self):
+        """
+        Verify malformed parameters are rejected.
+        """
+        for params in ({"bbox": "1,2,3", "zoom": 2}, {"bbox": "0,10,1,5", "zoom": 2},
+                       {"bbox": "0,0,1,1", "zoom": -1}, {"bbox": "-180,-85,180,85", "zoom": 16}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
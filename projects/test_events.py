@@ -0,0 +1,173 @@
+"""
+Project Event Stream Test Module
+
+This module contains tests for the Server-Sent Events stream of project
+changes at /api/projects/events/.
+"""
+
+import asyncio
+import datetime
+from unittest.mock import patch
+from asgiref.sync import sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from projects.events import broadcaster
+from projects.models import Project
+
+
+async def read_chunk(stream):
+    """
+    Return the next chunk of a streaming response.
+    """
+    async for chunk in stream:
+        return chunk
+    raise AssertionError("The event stream ended.")
+
+
+def create_project(name, status="pending", latitude=None, longitude=None):
+    """
+    Create a project with default dates and location.
+    """
+    return Project.objects.create(
+        name=name, start_date=datetime.date(2025, 1, 1), status=status,
+        location="Campinas", latitude=latitude, longitude=longitude,
+    )
+
+
+@override_settings(PROJECTS_EVENTS_POLL_INTERVAL=0.01, PROJECTS_EVENTS_STREAM_LIFETIME=5)
+class ProjectEventStreamTests(TestCase):
+    """
+    Test case for the project event stream.
+
+    Tests include:
+    - Replaying changes after Last-Event-ID
+    - Receiving live changes from the broadcaster
+    - Status and bounding box filters
+    - Ending streams when the broadcaster cannot start
+    - Ending streams when the client disconnects
+    - Static files served by the ASGI application
+    - Parameter validation and the ASGI requirement
+    """
+
+    def setUp(self):
+        """
+        Create one project before any client connects.
+        """
+        self.url = reverse("project-events")
+        self.existing = create_project("Existing")
+
+    async def _open(self, **kwargs):
+        """
+        Open the stream and consume the initial retry message.
+        """
+        response = await self.async_client.get(self.url, **kwargs)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+        self.assertTrue((await read_chunk(stream)).startswith(b"retry:"))
+        return stream
+
+    async def _next_event(self, stream):
+        """
+        Return the next non-keepalive message from the stream.
+        """
+        while True:
+            chunk = await asyncio.wait_for(read_chunk(stream), timeout=2)
+            if not chunk.startswith(b":"):
+                return chunk.decode()
+
+    async def test_resume_from_last_event_id(self):
+        """
+        Verify changes after Last-Event-ID are replayed.
+        """
+        stream = await self._open(headers={"Last-Event-ID": "0"})
+        message = await self._next_event(stream)
+        self.assertIn("event: created", message)
+        self.assertIn(str(self.existing.uuid), message)
+        await stream.aclose()
+
+    async def test_live_events_with_filters(self):
+        """
+        Verify live events arrive and filters skip non-matching projects.
+        """
+        stream = await self._open(data={"status": "completed", "bbox": "-50,-25,-45,-20"})
+        await sync_to_async(create_project)("Pending", "pending", -22.9, -47.06)
+        await sync_to_async(create_project)("Outside", "completed", 38.7, -9.1)
+        inside = await sync_to_async(create_project)("Inside", "completed", -22.9, -47.06)
+
+        message = await self._next_event(stream)
+        self.assertIn("event: created", message)
+        self.assertIn(str(inside.uuid), message)
+
+        await sync_to_async(Project.objects.filter(pk=inside.pk).delete)()
+        self.assertIn("event: deleted", await self._next_event(stream))
+        await stream.aclose()
+
+    async def test_invalid_parameters(self):
+        """
+        Verify malformed filters and resume ids are rejected.
+        """
+        for kwargs in ({"data": {"status": "unknown"}}, {"data": {"bbox": "1,2"}},
+                       {"headers": {"Last-Event-ID": "abc"}}):
+            response = await self.async_client.get(self.url, **kwargs)
+            self.assertEqual(response.status_code, 400, kwargs)
+
+    async def test_stream_ends_if_broadcaster_fails(self):
+        """
+        Verify streams end instead of hanging when the change log is unreadable.
+        """
+        async def read_all(stream):
+            return [chunk async for chunk in stream]
+
+        with patch("projects.events.settled_head_seq", side_effect=RuntimeError):
+            response = await self.async_client.get(self.url)
+            with self.assertLogs("projects.events", "ERROR"):
+                chunks = await asyncio.wait_for(read_all(response.streaming_content), timeout=2)
+        self.assertEqual(chunks, [])
+
+    async def test_asgi_application_serves_static_files(self):
+        """
+        Verify the ASGI application serves static files, which uvicorn does not.
+        """
+        with patch("projects.health.start_warm_up"):
+            from geo_projects_service.asgi import application  # pylint: disable=import-outside-toplevel
+
+        communicator = ApplicationCommunicator(application, {
+            "type": "http", "method": "GET", "path": "/static/drf-yasg/redoc/redoc.min.js",
+            "query_string": b"", "headers": [],
+        })
+        await communicator.send_input({"type": "http.request", "body": b""})
+        start = await communicator.receive_output(timeout=5)
+        self.assertEqual(start["status"], 200)
+        await communicator.wait(timeout=5)
+
+    async def test_disconnect_ends_stream(self):
+        """
+        Verify a client that disconnects is unsubscribed without waiting for
+        the stream lifetime.
+        """
+        with patch("projects.health.start_warm_up"):
+            from geo_projects_service.asgi import application  # pylint: disable=import-outside-toplevel
+
+        communicator = ApplicationCommunicator(application, {
+            "type": "http", "method": "GET", "path": self.url,
+            "query_string": b"", "headers": [],
+        })
+        # The handler reads in its own thread, outside the test transaction.
+        with patch("projects.events.settled_head_seq", return_value=0), \
+                patch("projects.events.load_events", return_value=[]):
+            await communicator.send_input({"type": "http.request", "body": b""})
+            self.assertEqual((await communicator.receive_output(timeout=5))["status"], 200)
+            body = await communicator.receive_output(timeout=5)
+            self.assertTrue(body["body"].startswith(b"retry:"))
+            self.assertEqual(len(broadcaster._subscriptions), 1)  # pylint: disable=protected-access
+
+            await communicator.send_input({"type": "http.disconnect"})
+            await asyncio.wait_for(communicator.future, timeout=2)  # wait() hides timeouts
+        self.assertEqual(len(broadcaster._subscriptions), 0)  # pylint: disable=protected-access
+
+    def test_requires_asgi(self):
+        """
+        Verify the stream is refused outside the ASGI application.
+        """
+        self.assertEqual(self.client.get(self.url).status_code, 501)
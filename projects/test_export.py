@@ -0,0 +1,117 @@
+"""
+Project Columnar Export Test Module
+
+This module contains tests for the binary columnar export of project
+coordinates and its HTTP caching and range request handling.
+"""
+
+import datetime
+import struct
+import uuid
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.export import HEADER, MAGIC, NULL_COORDINATE, parse_byte_range
+from projects.models import Project
+
+
+class ProjectColumnarExportTests(APITestCase):
+    """
+    Test case for the columnar export.
+
+    Tests include:
+    - Decoding the documented layout
+    - Cache invalidation through the table version
+    - Conditional and range requests
+    """
+
+    def setUp(self):
+        """
+        Create one located and one unlocated project.
+        """
+        cache.clear()
+        self.located = Project.objects.create(
+            name="Located", start_date=datetime.date(2025, 1, 1), status="completed",
+            location="Campinas", latitude="-22.905560", longitude="-47.060830",
+        )
+        self.unlocated = Project.objects.create(
+            name="Unlocated", start_date=datetime.date(2025, 1, 1), status="pending",
+            location="Nowhere",
+        )
+        self.url = reverse("project-export-columnar")
+
+    @staticmethod
+    def _decode(document):
+        """
+        Decode a columnar document into a list of row tuples.
+        """
+        magic, _, count = HEADER.unpack_from(document)
+        assert magic == MAGIC
+        offset = HEADER.size
+        uuids = [uuid.UUID(bytes=document[offset + 16 * i:offset + 16 * (i + 1)])
+                 for i in range(count)]
+        offset += 16 * count
+        statuses = list(document[offset:offset + count])
+        offset += count + (-count % 4)
+        latitudes = struct.unpack_from(f"<{count}i", document, offset)
+        longitudes = struct.unpack_from(f"<{count}i", document, offset + 4 * count)
+        return list(zip(uuids, statuses, latitudes, longitudes))
+
+    def test_export_layout(self):
+        """
+        Verify the document decodes to the stored projects.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Project-Status-Codes"], "pending,in_progress,completed")
+        self.assertEqual(self._decode(response.content), [
+            (self.located.uuid, 2, -22905560, -47060830),
+            (self.unlocated.uuid, 0, NULL_COORDINATE, NULL_COORDINATE),
+        ])
+
+    def test_export_follows_writes(self):
+        """
+        Verify a write changes the ETag and the cached document.
+        """
+        first = self.client.get(self.url)
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+        self.unlocated.delete()
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._decode(second.content)), 1)
+
+    def test_range_requests(self):
+        """
+        Verify partial, stale If-Range and unsatisfiable range requests.
+        """
+        full = self.client.get(self.url)
+        size = len(full.content)
+
+        partial = self.client.get(self.url, HTTP_RANGE="bytes=16-47")
+        self.assertEqual(partial.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(partial["Content-Range"], f"bytes 16-47/{size}")
+        self.assertEqual(partial.content, full.content[16:48])
+
+        stale = self.client.get(self.url, HTTP_RANGE="bytes=16-47", HTTP_IF_RANGE='"0-0"')
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
+
+        beyond = self.client.get(self.url, HTTP_RANGE=f"bytes={size}-")
+        self.assertEqual(beyond.status_code, status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+
+    def test_parse_byte_range(self):
+        """
+        Verify Range header parsing.
+        """
+        self.assertEqual(parse_byte_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(parse_byte_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=50-500", 100), (50, 99))
+        self.assertIsNone(parse_byte_range("bytes=0-1,5-6", 100))
+        self.assertIsNone(parse_byte_range("items=0-1", 100))
+        self.assertIsNone(parse_byte_range(None, 100))
+        with self.assertRaises(ValueError):
+            parse_byte_range("bytes=100-", 100)
@@ -0,0 +1,158 @@
+"""
+Project Geofence Test Module
+
+This module contains tests for the prepared polygon regions and the
+POST /api/projects/within/ endpoint.
+"""
+
+import datetime
+import math
+import numpy as np
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.geofence import PreparedRegion, prepare_region
+from projects.models import Project
+
+SQUARE = [[-50, -25], [-40, -25], [-40, -15], [-50, -15], [-50, -25]]
+HOLE = [[-46, -21], [-44, -21], [-44, -19], [-46, -19], [-46, -21]]
+TRIANGLE = [[10, 10], [20, 10], [15, 20], [10, 10]]
+
+
+def ray_cast(polygons, longitude, latitude):
+    """
+    Reference even-odd point-in-polygon test, one edge at a time.
+    """
+    inside = False
+    for polygon in polygons:
+        for ring in polygon:
+            for (x0, y0), (x1, y1) in zip(ring, ring[1:]):
+                if (y0 > latitude) != (y1 > latitude):
+                    if longitude < x0 + (latitude - y0) * (x1 - x0) / (y1 - y0):
+                        inside = not inside
+    return inside
+
+
+class PreparedRegionTests(SimpleTestCase):
+    """
+    Test case for the vectorized point-in-polygon test.
+
+    Tests include:
+    - Holes and multiple polygons
+    - Agreement with a reference implementation on a large polygon
+    """
+
+    def test_holes_and_multipolygons(self):
+        """
+        Verify points in holes are outside and every polygon is searched.
+        """
+        region = PreparedRegion(((tuple(map(tuple, SQUARE)), tuple(map(tuple, HOLE))),
+                                 (tuple(map(tuple, TRIANGLE)),)))
+        points = np.array([[-48, -23], [-45, -20], [15, 12], [0, 0], [-41, -16]])
+        self.assertEqual(
+            region.contains(points[:, 0], points[:, 1]).tolist(), [True, False, True, False, True]
+        )
+        self.assertEqual(region.bbox, (-50, -25, 20, 20))
+
+    def test_matches_reference_on_large_polygon(self):
+        """
+        Verify the banded test agrees with edge-by-edge ray casting.
+        """
+        vertices = 2000
+        angles = [2 * math.pi * i / vertices for i in range(vertices)]
+        ring = [
+            (math.cos(angle) * (10 + 4 * math.sin(17 * angle)),
+             math.sin(angle) * (10 + 4 * math.sin(17 * angle)))
+            for angle in angles
+        ]
+        polygons = ((tuple(ring + ring[:1]),),)
+        region = PreparedRegion(polygons)
+        points = np.random.default_rng(7).uniform(-15, 15, size=(500, 2))
+
+        expected = [ray_cast(polygons, x, y) for x, y in points]
+        self.assertEqual(region.contains(points[:, 0], points[:, 1]).tolist(), expected)
+        self.assertTrue(any(expected) and not all(expected))
+
+
+class ProjectWithinTests(APITestCase):
+    """
+    Test case for the geofence endpoint.
+
+    Tests include:
+    - Selecting projects inside a polygon with a hole
+    - Paging through results with the cursor
+    - Reusing prepared regions
+    - Validation of geometries
+    """
+
+    def setUp(self):
+        """
+        Create projects inside, outside, in the hole and without coordinates.
+        """
+        self.url = reverse("project-within")
+        coordinates = {
+            "Inside A": (-23, -48), "Inside B": (-16, -41), "Inside C": (-24, -49),
+            "In hole": (-20, -45), "Outside": (-23, -38), "Unlocated": (None, None),
+        }
+        self.projects = {
+            name: Project.objects.create(
+                name=name, start_date=datetime.date(2025, 1, 1), status="pending",
+                location=name, latitude=latitude, longitude=longitude,
+            )
+            for name, (latitude, longitude) in coordinates.items()
+        }
+        self.geometry = {"type": "Polygon", "coordinates": [SQUARE, HOLE]}
+
+    def _names(self, data):
+        """
+        Return the names of the projects in a response page.
+        """
+        return [project["name"] for project in data["results"]]
+
+    def test_within_polygon(self):
+        """
+        Verify only projects inside the polygon and outside its hole match.
+        """
+        response = self.client.post(self.url, {"geometry": self.geometry}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._names(response.data), ["Inside A", "Inside B", "Inside C"])
+        self.assertFalse(response.data["has_more"])
+        self.assertIsNone(response.data["cursor"])
+
+    def test_paging_and_region_cache(self):
+        """
+        Verify the cursor pages through results and the region is prepared once.
+        """
+        prepare_region.cache_clear()
+        names = []
+        body = {"geometry": {"type": "MultiPolygon", "coordinates": [[SQUARE, HOLE]]}, "limit": 2}
+        while True:
+            data = self.client.post(self.url, body, format="json").data
+            names += self._names(data)
+            if not data["has_more"]:
+                break
+            body["cursor"] = data["cursor"]
+
+        self.assertEqual(names, ["Inside A", "Inside B", "Inside C"])
+        self.assertEqual(prepare_region.cache_info().misses, 1)
+        self.assertGreaterEqual(prepare_region.cache_info().hits, 1)
+
+    def test_geometry_validation(self):
+        """
+        Verify malformed geometries and cursors are rejected.
+        """
+        invalid = [
+            {},
+            {"geometry": {"type": "Point", "coordinates": [0, 0]}},
+            {"geometry": {"type": "Polygon", "coordinates": []}},
+            {"geometry": {"type": "Polygon", "coordinates": [SQUARE[:-1]]}},
+            {"geometry": {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 1]]]}},
+            {"geometry": {"type": "Polygon", "coordinates": [[[0, 0], [200, 0], [0, 1], [0, 0]]]}},
+            {"geometry": {"type": "Polygon", "coordinates": [[[0, 0], ["a", 0], [0, 1], [0, 0]]]}},
+            {"geometry": self.geometry, "cursor": "!!!"},
+        ]
+        for body in invalid:
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, body)
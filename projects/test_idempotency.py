@@ -0,0 +1,185 @@
+"""
+Idempotency Key Test Module
+
+This module contains tests for Idempotency-Key handling on project create,
+update and bulk endpoints.
+"""
+
+import datetime
+import json
+from io import StringIO
+from unittest.mock import patch, Mock
+from django.core.management import call_command
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.idempotency import request_fingerprint
+from projects.models import IdempotencyKey, Project
+
+
+@patch("projects.google_maps.requests.get")
+class IdempotencyKeyTests(APITestCase):
+    """
+    Test case for idempotent writes.
+
+    Tests include:
+    - Replaying creates without geocoding again
+    - Rejecting keys reused for different requests
+    - Waiting for, and timing out on, requests still in progress
+    - Taking over keys of requests that never finished
+    - Releasing keys after server errors
+    - Bulk updates and purging expired keys
+    """
+
+    def setUp(self):
+        """
+        Prepare a project payload and its JSON encoding.
+        """
+        self.url = reverse("project-list")
+        self.body = json.dumps({
+            "name": "Retried Project", "start_date": "2025-01-01", "status": "pending",
+            "location": "Campinas, SP",
+        })
+
+    def _mock_geocoding(self, mock_requests_get):
+        """
+        Make the geocoding API return fixed coordinates.
+        """
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "status": "OK",
+            "results": [{"geometry": {"location": {"lat": -22.9, "lng": -47.06}}}],
+        }
+        mock_requests_get.return_value = mock_response
+
+    def _post(self, body=None, key="key-1"):
+        """
+        POST the project payload with an Idempotency-Key header.
+        """
+        return self.client.post(
+            self.url, body or self.body, content_type="application/json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def _claim(self, key="key-1", lease=datetime.timedelta(hours=1)):
+        """
+        Store an in-progress key as a concurrent first request would.
+        """
+        request = RequestFactory().post(self.url, self.body, content_type="application/json")
+        return IdempotencyKey.objects.create(
+            key=key, fingerprint=request_fingerprint(request),
+            expires_at=timezone.now() + lease,
+        )
+
+    def test_retry_replays_response(self, mock_requests_get):
+        """
+        Verify a retried create returns the first response without geocoding.
+        """
+        self._mock_geocoding(mock_requests_get)
+        first = self._post()
+        retry = self._post()
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(json.loads(retry.content), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(mock_requests_get.call_count, 1)
+        self.assertEqual(Project.objects.count(), 1)
+
+        without_key = self.client.post(self.url, self.body, content_type="application/json")
+        self.assertEqual(without_key.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_key_reused_for_other_request(self, mock_requests_get):
+        """
+        Verify a key cannot be reused with a different body.
+        """
+        self._mock_geocoding(mock_requests_get)
+        self._post()
+        response = self._post(self.body.replace("Retried", "Other"))
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        response = self._post(key="")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_duplicate_waits_for_first_request(self, mock_requests_get):
+        """
+        Verify a duplicate of a running request waits for its response.
+        """
+        row = self._claim()
+
+        def finish(_seconds):
+            IdempotencyKey.objects.filter(pk=row.pk).update(
+                status_code=201, content_type="application/json", body=b'{"done": true}'
+            )
+
+        with patch("projects.idempotency.time.sleep", side_effect=finish):
+            response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(json.loads(response.content), {"done": True})
+        mock_requests_get.assert_not_called()
+
+    @override_settings(PROJECTS_IDEMPOTENCY_WAIT_SECONDS=0)
+    def test_duplicate_times_out(self, mock_requests_get):
+        """
+        Verify a duplicate gets 409 if the first request does not finish in time.
+        """
+        self._claim()
+        response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        mock_requests_get.assert_not_called()
+
+    def test_stale_claim_is_reclaimed(self, mock_requests_get):
+        """
+        Verify a key whose request died is taken over once its lease expires,
+        and kept for the full TTL only once the response is stored.
+        """
+        self._mock_geocoding(mock_requests_get)
+        leases = []
+
+        def geocode(*args, **kwargs):
+            leases.append(IdempotencyKey.objects.get(key="key-1").expires_at)
+            return mock_requests_get.return_value
+
+        mock_requests_get.side_effect = geocode
+        self._claim(lease=datetime.timedelta(seconds=-1))
+        response = self._post()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertLessEqual(leases[0], timezone.now() + datetime.timedelta(seconds=60))
+        row = IdempotencyKey.objects.get(key="key-1")
+        self.assertEqual(row.status_code, status.HTTP_201_CREATED)
+        self.assertGreater(row.expires_at, timezone.now() + datetime.timedelta(hours=23))
+
+    def test_server_error_releases_key(self, mock_requests_get):
+        """
+        Verify a failed request can be retried with the same key.
+        """
+        self._mock_geocoding(mock_requests_get)
+        with patch("projects.views.ProjectViewSet.perform_create", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self._post()
+        self.assertFalse(IdempotencyKey.objects.exists())
+        self.assertEqual(self._post().status_code, status.HTTP_201_CREATED)
+
+    def test_bulk_update_and_purge(self, mock_requests_get):
+        """
+        Verify bulk updates are replayed and expired keys are purged.
+        """
+        Project.objects.create(
+            name="Existing", start_date=datetime.date(2025, 1, 1), status="pending",
+            location="X",
+        )
+        body = {"filter": {"status": "pending"}, "values": {"status": "completed"}}
+        url = reverse("project-bulk")
+        first = self.client.patch(url, body, format="json", HTTP_IDEMPOTENCY_KEY="bulk")
+        retry = self.client.patch(url, body, format="json", HTTP_IDEMPOTENCY_KEY="bulk")
+        self.assertEqual(first.data, {"updated": 1})
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(json.loads(retry.content), {"updated": 1})
+        mock_requests_get.assert_not_called()
+
+        IdempotencyKey.objects.update(expires_at=timezone.now() - datetime.timedelta(seconds=1))
+        out = StringIO()
+        call_command("purge_idempotency_keys", stdout=out)
+        self.assertIn("Purged 1 expired", out.getvalue())
+        self.assertFalse(IdempotencyKey.objects.exists())
@@ -0,0 +1,158 @@
+"""
+Project Route Planning Test Module
+
+This module contains tests for the route planner and the
+POST /api/projects/route/ endpoint.
+"""
+
+import datetime
+import itertools
+import uuid
+from io import StringIO
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.models import Project
+from projects.route import distance_matrix, path_length, plan_route
+
+
+class RoutePlannerTests(SimpleTestCase):
+    """
+    Test case for the route planner.
+
+    Tests include:
+    - Haversine distances
+    - Optimal orders on small instances, with and without a start point
+    - The time budget
+    """
+
+    def test_distance_matrix(self):
+        """
+        Verify one degree of latitude is about 111 km and the matrix is symmetric.
+        """
+        distances = distance_matrix([0, 1, 0], [0, 0, 1])
+        self.assertAlmostEqual(distances[0, 1], 111.19, places=1)
+        np.testing.assert_allclose(distances, distances.T)
+        np.testing.assert_allclose(np.diag(distances), 0)
+
+    def test_matches_brute_force(self):
+        """
+        Verify small routes are as short as the best permutation.
+        """
+        rng = np.random.default_rng(3)
+        for start in (None, (-22.5, -46.5)):
+            latitudes = rng.uniform(-23, -22, 6)
+            longitudes = rng.uniform(-47, -46, 6)
+            result = plan_route(latitudes, longitudes, start=start, budget=5)
+
+            head = [] if start is None else [6]
+            distances = distance_matrix(
+                [*latitudes, *([start[0]] if start else [])],
+                [*longitudes, *([start[1]] if start else [])],
+            )
+            best = min(
+                path_length(distances, head + list(order))
+                for order in itertools.permutations(range(6))
+            )
+            self.assertTrue(result["converged"])
+            self.assertEqual(sorted(result["order"]), list(range(6)))
+            self.assertAlmostEqual(result["distance_km"], best, places=6)
+            self.assertLessEqual(result["distance_km"], result["initial_distance_km"])
+
+    def test_time_budget(self):
+        """
+        Verify a zero budget returns the nearest-neighbour route unimproved.
+        """
+        rng = np.random.default_rng(5)
+        result = plan_route(rng.uniform(0, 1, 300), rng.uniform(0, 1, 300), budget=0)
+        self.assertFalse(result["converged"])
+        self.assertEqual(result["distance_km"], result["initial_distance_km"])
+        self.assertEqual(sorted(result["order"]), list(range(300)))
+
+
+@override_settings(PROJECTS_ROUTE_TIME_BUDGET=1.0)
+class ProjectRouteTests(APITestCase):
+    """
+    Test case for the route planning endpoint.
+
+    Tests include:
+    - Ordering projects along a road from a start point
+    - Validation of the requested projects
+    - The benchmark command
+    """
+
+    def setUp(self):
+        """
+        Create projects spaced along a meridian, and one without coordinates.
+        """
+        self.url = reverse("project-route")
+        self.along_road = [
+            Project.objects.create(
+                name=f"Stop {i}", start_date=datetime.date(2025, 1, 1), status="pending",
+                location=f"Km {i * 10}", latitude=-22 - i / 10, longitude=-47,
+            )
+            for i in range(6)
+        ]
+        self.unlocated = Project.objects.create(
+            name="Unlocated", start_date=datetime.date(2025, 1, 1), status="pending",
+            location="Unknown",
+        )
+
+    def test_route_from_start(self):
+        """
+        Verify stops are visited in order along the road from the start.
+        """
+        shuffled = [self.along_road[i] for i in (3, 0, 5, 1, 4, 2)]
+        response = self.client.post(self.url, {
+            "uuids": [str(p.uuid) for p in shuffled],
+            "start": {"latitude": -21.9, "longitude": -47},
+        }, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["order"], [str(p.uuid) for p in self.along_road])
+        self.assertAlmostEqual(response.data["total_distance_km"], 66.7, places=1)
+        self.assertTrue(response.data["converged"])
+
+    def test_route_without_start(self):
+        """
+        Verify the route starts at one end of the road without a start point.
+        """
+        response = self.client.post(self.url, {
+            "uuids": [str(p.uuid) for p in reversed(self.along_road)],
+        }, format="json")
+
+        order = response.data["order"]
+        self.assertIn(order, (
+            [str(p.uuid) for p in self.along_road],
+            [str(p.uuid) for p in reversed(self.along_road)],
+        ))
+        self.assertAlmostEqual(response.data["total_distance_km"], 55.6, places=1)
+
+    def test_route_validation(self):
+        """
+        Verify unknown, unlocated, repeated and missing projects are rejected.
+        """
+        first = str(self.along_road[0].uuid)
+        invalid = [
+            {"uuids": []},
+            {"uuids": [first, first]},
+            {"uuids": [first, str(uuid.uuid4())]},
+            {"uuids": [first, str(self.unlocated.uuid)]},
+            {"uuids": [first], "start": {"latitude": 95, "longitude": 0}},
+        ]
+        for body in invalid:
+            response = self.client.post(self.url, body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, body)
+
+    def test_benchmark_command(self):
+        """
+        Verify the benchmark reports one row per size.
+        """
+        out = StringIO()
+        call_command("benchmark_route", "--sizes", "20", "40", "--budget", "0.5", stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines[1:3]], ["20", "40"])
+        self.assertIn("Time budget: 0.5 s", lines[-1])
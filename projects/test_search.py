@@ -0,0 +1,117 @@
+"""
+Project Full-Text Search Test Module
+
+This module contains tests for the full-text search index and the
+/api/projects/search/ endpoint, including index synchronisation on writes,
+prefix matching, ranking, highlighting and pagination.
+"""
+
+import datetime
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.models import Project
+from projects.search import parse_terms, search_projects
+
+
+class ProjectSearchTests(APITestCase):
+    """
+    Test case for full-text search over projects.
+
+    Tests include:
+    - Index synchronisation on insert, update and delete
+    - Prefix matching and multi-term AND semantics
+    - Ranking of name matches above description matches
+    - Highlighting and pagination of the search endpoint
+    - Escaping stored markup in highlights
+    """
+
+    def setUp(self):
+        """
+        Create a few projects with distinct searchable text.
+        """
+        self.bridge = Project.objects.create(
+            name="River Bridge",
+            description="Replacing the old crossing",
+            start_date=datetime.date(2025, 1, 1),
+            status="pending",
+            location="Campinas, SP",
+        )
+        self.school = Project.objects.create(
+            name="School Renovation",
+            description="New roof next to the bridge",
+            start_date=datetime.date(2025, 2, 1),
+            status="in_progress",
+            location="Sao Paulo, SP",
+        )
+
+    def _search(self, query):
+        """
+        Return the names of projects matching ``query`` in rank order.
+        """
+        return [p.name for p in search_projects(Project.objects.all(), query)]
+
+    def test_parse_terms_strips_query_syntax(self):
+        """
+        Verify that FTS operators and quotes in user input are discarded.
+        """
+        self.assertEqual(parse_terms('bridge" OR name:*'), ["bridge", "OR", "name"])
+        self.assertEqual(parse_terms("   "), [])
+
+    def test_prefix_and_ranking(self):
+        """
+        Verify prefix matching and that name matches outrank description matches.
+        """
+        self.assertEqual(self._search("brid"), ["River Bridge", "School Renovation"])
+        self.assertEqual(self._search("roof brid"), ["School Renovation"])
+        self.assertEqual(self._search("nothing"), [])
+
+    def test_index_follows_writes(self):
+        """
+        Verify that updates and deletes through the ORM keep the index in sync.
+        """
+        self.school.description = "Painting walls"
+        self.school.save()
+        self.assertEqual(self._search("bridge"), ["River Bridge"])
+
+        Project.objects.filter(pk=self.bridge.pk).update(name="Harbour Pier")
+        self.assertEqual(self._search("bridge"), [])
+        self.assertEqual(self._search("pier"), ["Harbour Pier"])
+
+        self.bridge.delete()
+        self.assertEqual(self._search("pier"), [])
+
+    def test_search_endpoint(self):
+        """
+        Verify the search endpoint returns paginated, highlighted results.
+        """
+        url = reverse("project-search")
+        response = self.client.get(url, {"q": "bridge", "page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        self.assertIsNotNone(response.data["next"])
+        result = response.data["results"][0]
+        self.assertEqual(result["name"], "River Bridge")
+        self.assertIn("<mark>Bridge</mark>", result["search_highlight"])
+        self.assertGreater(result["search_rank"], 0)
+
+    def test_highlight_escapes_stored_text(self):
+        """
+        Verify markup stored in project fields is escaped in highlights.
+        """
+        Project.objects.create(
+            name="<img src=x onerror=alert(1)> Viaduct", start_date=datetime.date(2025, 1, 1),
+            status="pending", location="Campinas",
+        )
+        response = self.client.get(reverse("project-search"), {"q": "viaduct"})
+        highlight = response.data["results"][0]["search_highlight"]
+        self.assertNotIn("<img", highlight)
+        self.assertIn("&lt;img src=x onerror=alert(1)&gt; <mark>Viaduct</mark>", highlight)
+
+    def test_search_endpoint_requires_query(self):
+        """
+        Verify that a missing or blank query is rejected.
+        """
+        response = self.client.get(reverse("project-search"), {"q": " "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,155 @@
+"""
+Startup Test Module
+
+This module contains tests for the precomputed OpenAPI schema, the warm-up
+readiness probe and the startup management commands.
+"""
+
+import json
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from projects import health
+from projects.management.commands.benchmark_startup import parse_import_times
+from projects.schema import load_schema, reset_schema
+
+
+class StartupTests(TestCase):
+    """
+    Test case for startup artifacts and readiness.
+
+    Tests include:
+    - Building and serving the schema artifact with cache validators
+    - Generating the schema in memory when switched off or without the artifact
+    - Linking the documentation page to the versioned schema
+    - Reporting readiness only after warm-up
+    - Benchmarking startup in fresh processes
+    """
+
+    def setUp(self):
+        """
+        Point the schema artifact at a temporary directory and serve it, as
+        the Docker image does.
+        """
+        directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.schema_path = Path(directory.name) / "openapi.json"
+        settings_override = override_settings(
+            PROJECTS_SCHEMA_PATH=str(self.schema_path), PROJECTS_SCHEMA_FROM_ARTIFACT=True,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        reset_schema()
+        self.addCleanup(reset_schema)
+
+    def test_build_command_writes_schema(self):
+        """
+        Verify the build command writes the schema that is then served.
+        """
+        out = StringIO()
+        call_command("build_openapi_schema", stdout=out)
+        self.assertIn("Wrote OpenAPI schema", out.getvalue())
+        document = json.loads(self.schema_path.read_bytes())
+        self.assertIn("/projects/", document["paths"])
+
+        response = self.client.get(reverse("schema-json"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, self.schema_path.read_bytes())
+
+    def test_schema_caching(self):
+        """
+        Verify ETag revalidation and long caching of versioned schema URLs.
+        """
+        url = reverse("schema-json")
+        with self.assertLogs("projects.schema", "WARNING"):
+            response = self.client.get(url)
+        self.assertFalse(self.schema_path.exists())  # generated in memory only
+        self.assertEqual(response["Cache-Control"], "public, max-age=300")
+
+        _, version = load_schema()
+        self.assertEqual(response["ETag"], f'"{version}"')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=f'"{version}"')
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        response = self.client.get(url, {"v": version})
+        self.assertIn("immutable", response["Cache-Control"])
+        response = self.client.get(url, {"v": "stale"})
+        self.assertEqual(response["Cache-Control"], "public, max-age=300")
+
+    @override_settings(DEBUG=True)
+    def test_schema_artifact_switch(self):
+        """
+        Verify the artifact is served whenever the switch is on, even with
+        DEBUG on, and the schema is generated from the code otherwise.
+        """
+        self.schema_path.write_text('{"stale": true}')
+        self.assertEqual(load_schema()[0], b'{"stale": true}')
+
+        reset_schema()
+        with override_settings(PROJECTS_SCHEMA_FROM_ARTIFACT=False):
+            content, _ = load_schema()
+        self.assertIn("/projects/", json.loads(content)["paths"])
+        self.assertEqual(self.schema_path.read_text(), '{"stale": true}')
+
+    def test_docs_link_versioned_schema(self):
+        """
+        Verify the documentation page loads the current schema version.
+        """
+        with self.assertLogs("projects.schema", "WARNING"):  # no artifact
+            _, version = load_schema()
+        response = self.client.get(reverse("schema-redoc"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, f'spec-url="{reverse("schema-json")}?v={version}"')
+
+    def test_readiness(self):
+        """
+        Verify the probe reports 503 until the warm-up has finished.
+        """
+        self.addCleanup(health._ready.clear)  # pylint: disable=protected-access
+        health._ready.clear()  # pylint: disable=protected-access
+        response = self.client.get(reverse("readiness"))
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response.json(), {"ready": False})
+        self.assertEqual(response["Cache-Control"], "no-store")
+
+        with self.assertLogs("projects.schema", "WARNING"):  # no artifact
+            self.assertGreaterEqual(health.warm_up(), 0)
+        response = self.client.get(reverse("readiness"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"ready": True})
+
+    def test_parse_import_times(self):
+        """
+        Verify import self times are summed by top-level package.
+        """
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     numpy.core",
+            "import time:       250 |        350 |   numpy",
+            "import time:        50 |         50 | json",
+        ])
+        totals = parse_import_times(output)
+        self.assertAlmostEqual(totals["numpy"], 0.00035)
+        self.assertAlmostEqual(totals["json"], 0.00005)
+
+    def test_benchmark_command(self):
+        """
+        Verify the benchmark reports both modes and the import breakdown.
+        """
+        database = self.schema_path.with_name("benchmark.sqlite3")
+        environment = {"SCHEMA_PATH": str(self.schema_path), "DB_NAME": str(database)}
+        out = StringIO()
+        with patch.dict(os.environ, environment):
+            call_command("benchmark_startup", "--runs", "1", "--path", "/api/ready/", stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertEqual([line.split()[0] for line in lines[1:3]], ["cold", "warm"])
+        self.assertEqual(lines[1].split()[-1], "503")
+        self.assertEqual(lines[2].split()[-1], "200")
+        self.assertTrue(any(line.split()[0] == "numpy" for line in lines[4:]))
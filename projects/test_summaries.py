@@ -0,0 +1,146 @@
+"""
+Project Statistics Test Module
+
+This module contains tests for the incrementally maintained project statistics
+summary table, the /api/projects/stats/ endpoint and the reconciliation command.
+"""
+
+import datetime
+from io import StringIO
+from unittest.mock import patch, Mock
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from projects.bulk import delete_projects, update_projects
+from projects.clusters import rebuild_clusters
+from projects.models import Project, ProjectChange, ProjectCluster, ProjectStatistic
+from projects.summaries import (
+    cell_key, compute_statistics, read_statistics, reconcile_statistics,
+)
+
+
+class ProjectStatisticsTests(APITestCase):
+    """
+    Test case for project statistics.
+
+    Tests include:
+    - Cell key computation
+    - Summary maintenance through the API, model saves and bulk writes
+    - Saves of coordinates with more decimals than the database stores
+    - The statistics endpoint
+    - Reconciliation after drift
+    """
+
+    def setUp(self):
+        """
+        Create projects in two statuses, two months and two cells.
+        """
+        self.first = Project.objects.create(
+            name="First", start_date=datetime.date(2025, 1, 10), status="pending",
+            location="Campinas", latitude=-22.9, longitude=-47.06,
+        )
+        self.second = Project.objects.create(
+            name="Second", start_date=datetime.date(2025, 2, 3), status="completed",
+            location="Nowhere",
+        )
+
+    def assertSummaryMatchesTable(self):  # pylint: disable=invalid-name
+        """
+        Assert that the summary table equals a fresh aggregation.
+        """
+        stored = {
+            (row.dimension, row.key): row.count
+            for row in ProjectStatistic.objects.exclude(count=0)
+        }
+        self.assertEqual(stored, dict(compute_statistics(Project.objects.all())))
+
+    def test_cell_key(self):
+        """
+        Verify cells are keyed by their south-west corner.
+        """
+        self.assertEqual(cell_key(-22.9, -47.06), "-23,-48")
+        self.assertEqual(cell_key(0.5, 10), "0,10")
+        self.assertEqual(cell_key(None, 10), "unlocated")
+
+    def test_summary_follows_model_writes(self):
+        """
+        Verify saves, updates and deletes adjust the summary.
+        """
+        self.assertSummaryMatchesTable()
+        self.second.status = "pending"
+        self.second.latitude, self.second.longitude = 10.5, 20.5
+        self.second.save()
+        self.assertSummaryMatchesTable()
+        self.first.delete()
+        self.assertSummaryMatchesTable()
+        self.assertEqual(read_statistics()["by_status"], {"pending": 1})
+
+    def test_summary_follows_bulk_writes(self):
+        """
+        Verify set-based updates and deletes adjust the summary.
+        """
+        update_projects(Project.objects.all(), status="in_progress")
+        self.assertSummaryMatchesTable()
+        delete_projects(Project.objects.filter(pk=self.first.pk))
+        self.assertSummaryMatchesTable()
+        self.assertEqual(read_statistics()["total"], 1)
+
+    def test_unrounded_coordinates_do_not_drift(self):
+        """
+        Verify saves of coordinates with more decimals than stored do not drift.
+        """
+        project = Project.objects.create(
+            name="Unrounded", start_date=datetime.date(2025, 3, 1), status="pending",
+            location="Somewhere", latitude=10.5, longitude=-47.0000004,
+        )
+        project.status = "completed"
+        project.save()
+        project.delete()
+
+        self.assertEqual(reconcile_statistics(), 0)
+        cells = ProjectCluster.objects.exclude(count=0).order_by("zoom", "cell_x", "cell_y")
+        grid = list(cells.values_list("zoom", "cell_x", "cell_y", "count"))
+        rebuild_clusters()
+        self.assertEqual(grid, list(cells.values_list("zoom", "cell_x", "cell_y", "count")))
+        operations = ProjectChange.objects.filter(project_uuid=project.uuid).order_by("seq")
+        self.assertEqual(
+            list(operations.values_list("operation", flat=True)),
+            ["created", "updated", "deleted"],
+        )
+
+    @patch("projects.google_maps.requests.get")
+    def test_stats_endpoint(self, mock_requests_get):
+        """
+        Verify the endpoint reflects projects created through the API.
+        """
+        mock_response = Mock()
+        mock_response.json.return_value = {
+            "status": "OK",
+            "results": [{"geometry": {"location": {"lat": -22.5, "lng": -47.5}}}],
+        }
+        mock_requests_get.return_value = mock_response
+        self.client.post(reverse("project-list"), {
+            "name": "Third", "start_date": "2025-01-20", "status": "pending",
+            "location": "Campinas, SP",
+        }, format="json")
+
+        response = self.client.get(reverse("project-stats"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total"], 3)
+        self.assertEqual(response.data["by_status"], {"completed": 1, "pending": 2})
+        self.assertEqual(response.data["by_start_month"], {"2025-01": 2, "2025-02": 1})
+        self.assertEqual(response.data["by_cell"], {"-23,-48": 2, "unlocated": 1})
+
+    def test_reconcile_command(self):
+        """
+        Verify the reconciliation command repairs a drifted summary.
+        """
+        ProjectStatistic.objects.filter(dimension="status").update(count=42)
+        ProjectStatistic.objects.create(dimension="cell", key="1,1", count=3)
+        Project.objects.filter(pk=self.first.pk).update(status="completed")
+
+        out = StringIO()
+        call_command("reconcile_project_stats", stdout=out)
+        self.assertIn("3 group(s) corrected", out.getvalue())
+        self.assertSummaryMatchesTable()
@@ -0,0 +1,55 @@
+"""
+Table Versioning
+
+This module keeps a ``TableVersion`` counter for the Project table that is
+incremented by every write announced through ``projects_changed``. Caches of
+data derived from the whole table include the version in their keys.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.dispatch import receiver
+
+from .models import TableVersion
+from .signals import projects_changed
+
+PROJECTS_TABLE = "projects"
+
+
+def current_version(name=PROJECTS_TABLE):
+    """
+    Return the current version of a table.
+
+    Args:
+        name (str): Name of the versioned table
+
+    Returns:
+        int: The version, 0 if the table has never changed
+    """
+    version = TableVersion.objects.filter(name=name).values_list("version", flat=True).first()
+    return version or 0
+
+
+def bump_version(name=PROJECTS_TABLE):
+    """
+    Increment the version of a table, creating its counter if needed.
+
+    Args:
+        name (str): Name of the versioned table
+    """
+    counter = TableVersion.objects.filter(name=name)
+    if counter.update(version=F("version") + 1):
+        return
+    try:
+        with transaction.atomic():
+            TableVersion.objects.create(name=name, version=1)
+    except IntegrityError:
+        counter.update(version=F("version") + 1)
+
+
+# pylint: disable=unused-argument
+@receiver(projects_changed)
+def bump_projects_version(sender, changes, **kwargs):
+    """
+    Invalidate whole-table caches after any project change.
+    """
+    bump_version()
@@ -8,10 +8,65 @@ Django REST Framework's ModelViewSet.
 The ViewSet handles all HTTP methods (GET, POST, PUT, PATCH, DELETE)
 and integrates with the ProjectSerializer for data validation and conversion.
 """
+import functools
+import hashlib
+import json
 
-from rest_framework import viewsets
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .bulk import delete_projects, update_projects
+from .changes import CursorExpired, encode_cursor, read_changes, settled_head_seq
+from .clusters import find_clusters
+from .events import stream_events
+from .export import (
+    CONTENT_TYPE as COLUMNAR_CONTENT_TYPE, FORMAT_VERSION as COLUMNAR_FORMAT_VERSION,
+    STATUS_CODES, cached_columnar_export, parse_byte_range,
+)
+from .idempotency import idempotent
 from .models import Project
-from .serializer import ProjectSerializer
+from .pagination import ProjectSearchPagination
+from .search import search_projects
+from .serializer import (
+    ChangeFeedQuerySerializer, ClusterQuerySerializer, ProjectBulkSelectionSerializer,
+    ProjectBulkUpdateSerializer, ProjectEventFilterSerializer, ProjectSearchSerializer,
+    ProjectRouteSerializer, ProjectSerializer, ProjectWithinQuerySerializer,
+)
+from .summaries import read_statistics
+from .versioning import current_version
+
+CLUSTERS_MAX_AGE = 60
+IDEMPOTENT_ACTIONS = frozenset({"create", "update", "partial_update", "bulk"})
+
+
+def cacheable_response(request, data, max_age):
+    """
+    Build a publicly cacheable response with an ETag derived from its data.
+
+    Args:
+        request (Request): The current request, checked for If-None-Match
+        data (object): JSON-serializable response data
+        max_age (int): Seconds shared caches and clients may reuse the response
+
+    Returns:
+        Response: The data, or an empty 304 response if the client's copy
+                  is still current
+    """
+    digest = hashlib.md5(
+        json.dumps(data, sort_keys=True).encode(), usedforsecurity=False
+    ).hexdigest()
+    etag = f'"{digest}"'
+    if request.headers.get("If-None-Match") == etag:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={max_age}"
+    return response
 
 
 # pylint: disable=too-many-ancestors
@@ -27,6 +82,18 @@ class ProjectViewSet(viewsets.ModelViewSet):
     - partial_update (PATCH /api/projects/{id}/)
     - destroy (DELETE /api/projects/{id}/)
 
+    Creates, updates and bulk writes accept an ``Idempotency-Key`` header.
+
+    Additional actions:
+    - search (GET /api/projects/search/?q=)
+    - stats (GET /api/projects/stats/)
+    - clusters (GET /api/projects/clusters/?bbox=&zoom=)
+    - export_columnar (GET /api/projects/export/columnar/)
+    - bulk (PATCH, DELETE /api/projects/bulk/)
+    - changes (GET /api/projects/changes/?cursor=)
+    - within (POST /api/projects/within/)
+    - route (POST /api/projects/route/)
+
     Attributes:
         queryset (QuerySet): The queryset that should be used for returning
                             objects from this view. Defaults to all Projects.
@@ -36,3 +103,356 @@ class ProjectViewSet(viewsets.ModelViewSet):
     """
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+
+    def dispatch(self, request, *args, **kwargs):
+        """
+        Run creates, updates and bulk writes at most once per Idempotency-Key.
+
+        See ``projects.idempotency``; other actions are dispatched as usual.
+        """
+        if self.action_map.get(request.method.lower()) not in IDEMPOTENT_ACTIONS:
+            return super().dispatch(request, *args, **kwargs)
+        return idempotent(request, functools.partial(super().dispatch, request, *args, **kwargs))
+
+    @action(
+        detail=False, methods=["get"],
+        serializer_class=ProjectSearchSerializer,
+        pagination_class=ProjectSearchPagination,
+    )
+    def search(self, request):
+        """
+        Full-text search over project name, location and description.
+
+        Query parameters:
+            q (str): Search terms; all must match and the last one is matched
+                     as a prefix
+            page (int): Page number of the results
+            page_size (int): Number of results per page
+
+        Returns:
+            Response: Paginated projects ordered by relevance, each with a
+                      ``search_rank`` and a highlighted ``search_highlight``
+        """
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"q": ["This query parameter is required."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = search_projects(self.get_queryset(), query)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def stats(self, request):
+        """
+        Project counts by status, start month and geographic cell.
+
+        Served from the incrementally maintained ``ProjectStatistic`` summary
+        table, so the cost does not grow with the number of projects.
+
+        Returns:
+            Response: ``total``, ``cell_size_degrees``, ``by_status``,
+                      ``by_start_month`` and ``by_cell`` counts
+        """
+        return Response(read_statistics())
+
+    @action(detail=False, methods=["get"])
+    def clusters(self, request):
+        """
+        Project clusters for a map viewport at a zoom level.
+
+        Served from the precomputed ``ProjectCluster`` grid. Responses carry an
+        ETag and may be cached publicly, so clients should request tile-aligned
+        bounding boxes to share cache entries.
+
+        Query parameters:
+            bbox (str): ``west,south,east,north`` in degrees
+            zoom (int): Map zoom level
+
+        Returns:
+            Response: ``zoom`` and a list of ``clusters`` with centroid
+                      coordinates, ``count`` and, for small clusters,
+                      ``project_uuids``
+        """
+        query = ClusterQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        try:
+            clusters = find_clusters(query.validated_data["bbox"], query.validated_data["zoom"])
+        except ValueError as e:
+            return Response({"bbox": [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+        data = {"zoom": query.validated_data["zoom"], "clusters": clusters}
+        return cacheable_response(request, data, CLUSTERS_MAX_AGE)
+
+    @action(detail=False, methods=["get"], url_path="export/columnar", url_name="export-columnar")
+    def export_columnar(self, request):
+        """
+        All project UUIDs, statuses and coordinates as packed binary columns.
+
+        See ``projects.export`` for the layout. The document is cached per
+        Project table version, which also serves as its ETag. Single byte
+        ranges are supported, including ``If-Range``.
+
+        Returns:
+            HttpResponse: The full document (200), a byte range (206), an
+                          empty revalidation response (304) or 416 for an
+                          unsatisfiable range
+        """
+        version = current_version()
+        etag = f'"{COLUMNAR_FORMAT_VERSION}-{version}"'
+        headers = {
+            "ETag": etag,
+            "Accept-Ranges": "bytes",
+            "Cache-Control": "public, no-cache",
+            "X-Project-Status-Codes": ",".join(STATUS_CODES),
+        }
+        if request.headers.get("If-None-Match") == etag:
+            return HttpResponse(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        document = cached_columnar_export(version)
+        size = len(document)
+        range_header = request.headers.get("Range")
+        if request.headers.get("If-Range", etag) != etag:
+            range_header = None
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except ValueError:
+            return HttpResponse(
+                status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
+        if byte_range is None:
+            return HttpResponse(document, content_type=COLUMNAR_CONTENT_TYPE, headers=headers)
+
+        start, end = byte_range
+        return HttpResponse(
+            document[start:end + 1],
+            status=status.HTTP_206_PARTIAL_CONTENT,
+            content_type=COLUMNAR_CONTENT_TYPE,
+            headers={**headers, "Content-Range": f"bytes {start}-{end}/{size}"},
+        )
+
+    @action(detail=False, methods=["patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Update or delete many projects with set-based statements.
+
+        The request body selects projects with either ``uuids`` (a list of
+        project UUIDs) or ``filter`` (an object of supported lookups, e.g.
+        ``{"status": "in_progress"}``). PATCH also takes ``values``: the fields
+        to set on every selected project, validated once. A new ``location``
+        is geocoded once, and only if some selected project is not already
+        there.
+
+        Returns:
+            Response: ``{"updated": n}`` for PATCH or ``{"deleted": n}`` for DELETE
+        """
+        if request.method == "DELETE":
+            selection = ProjectBulkSelectionSerializer(data=request.data)
+            selection.is_valid(raise_exception=True)
+            return Response({"deleted": delete_projects(selection.selected_projects())})
+
+        serializer = ProjectBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        projects = serializer.selected_projects()
+        values = dict(serializer.validated_data["values"])
+        if "location" not in values:
+            return Response({"updated": update_projects(projects, **values)})
+
+        location = values["location"]
+        moved = projects.exclude(location=location)
+        geocoded = serializer.fields["values"].geocode(values) if moved.exists() else values
+        with transaction.atomic():
+            # Projects already at the new location keep their coordinates; they
+            # are updated first so that ``moved`` still selects only the others.
+            updated = update_projects(projects.filter(location=location), **values)
+            updated += update_projects(moved, **geocoded)
+        return Response({"updated": updated})
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """
+        Projects created, updated or deleted since a cursor.
+
+        Without a cursor, no changes are returned, only a cursor for the
+        current head of the feed: fetch it before downloading the full project
+        list, then follow the feed from it. Changes are returned in sequence
+        order, collapsed to the latest one per project; deletions are
+        tombstones with ``project`` set to null.
+
+        Query parameters:
+            cursor (str): Cursor from a previous response
+            limit (int): Maximum number of changes to read (default 100)
+
+        Returns:
+            Response: ``changes``, the next ``cursor`` and ``has_more``, or
+                      410 Gone if the cursor has expired and a full resync
+                      is required
+        """
+        query = ChangeFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        if "cursor" not in query.validated_data:
+            return Response(
+                {"changes": [], "cursor": encode_cursor(settled_head_seq()), "has_more": False}
+            )
+
+        try:
+            entries, next_seq, has_more = read_changes(
+                query.validated_data["cursor"], query.validated_data["limit"]
+            )
+        except CursorExpired:
+            return Response(
+                {"detail": "The cursor has expired; a full resync is required.", "resync": True},
+                status=status.HTTP_410_GONE,
+            )
+
+        live = [entry.project_uuid for entry in entries if entry.operation != "deleted"]
+        projects = {project.uuid: project for project in self.get_queryset().filter(uuid__in=live)}
+        changes = []
+        for entry in entries:
+            project = projects.get(entry.project_uuid)
+            if entry.operation != "deleted" and project is None:
+                continue  # deleted after this change; its tombstone follows later
+            changes.append({
+                "seq": entry.seq,
+                "operation": entry.operation,
+                "uuid": str(entry.project_uuid),
+                "project": self.get_serializer(project).data if project else None,
+            })
+        return Response(
+            {"changes": changes, "cursor": encode_cursor(next_seq), "has_more": has_more}
+        )
+
+    @action(detail=False, methods=["post"])
+    def within(self, request):
+        """
+        Projects inside a GeoJSON Polygon or MultiPolygon region.
+
+        Candidates are selected by the region's bounding box with an indexed
+        coordinate query and then tested against the region itself (see
+        ``projects.geofence``). Results are paged in primary key order; to
+        read the next page, repeat the request with the returned ``cursor``.
+
+        Request body:
+            geometry (object): GeoJSON ``Polygon`` or ``MultiPolygon``
+            cursor (str): Cursor from the previous page
+            limit (int): Maximum number of projects per page (default 100)
+
+        Returns:
+            Response: ``results``, the ``cursor`` of the next page and
+                      ``has_more``
+        """
+        # NumPy is imported on first use to keep it out of startup.
+        from .geofence import find_within, prepare_region  # pylint: disable=import-outside-toplevel
+
+        query = ProjectWithinQuerySerializer(data=request.data)
+        query.is_valid(raise_exception=True)
+        region = prepare_region(query.validated_data["geometry"])
+        pks, position, has_more = find_within(
+            region, query.validated_data.get("cursor", 0), query.validated_data["limit"]
+        )
+        projects = self.get_queryset().in_bulk(pks)
+        results = self.get_serializer([projects[pk] for pk in pks if pk in projects], many=True)
+        return Response({
+            "results": results.data,
+            "cursor": encode_cursor(position) if has_more else None,
+            "has_more": has_more,
+        })
+
+    @action(detail=False, methods=["post"])
+    def route(self, request):
+        """
+        A short order in which to visit a set of projects.
+
+        The route is an open path: it starts at ``start`` if given, or at one
+        of the projects, and ends at the last project visited. It is planned
+        with a nearest-neighbour tour improved by 2-opt and Or-opt moves
+        within the ``PROJECTS_ROUTE_TIME_BUDGET`` (see ``projects.route``).
+
+        Request body:
+            uuids (list[str]): UUIDs of the projects to visit; each must have
+                               coordinates
+            start (object): Optional ``latitude`` and ``longitude`` to start from
+
+        Returns:
+            Response: ``order`` (project UUIDs in visiting order),
+                      ``total_distance_km`` (great-circle length of the route)
+                      and ``converged`` (False if the time budget ran out
+                      before no move could improve the route)
+        """
+        from .route import plan_route  # pylint: disable=import-outside-toplevel
+
+        query = ProjectRouteSerializer(data=request.data)
+        query.is_valid(raise_exception=True)
+        uuids = query.validated_data["uuids"]
+        rows = self.get_queryset().filter(uuid__in=uuids).values_list(
+            "uuid", "latitude", "longitude"
+        )
+        coordinates = {project_uuid: (lat, lng) for project_uuid, lat, lng in rows}
+        unknown = [str(u) for u in uuids if u not in coordinates]
+        unlocated = [str(u) for u in uuids if None in coordinates.get(u, ())]
+        if unknown or unlocated:
+            errors = []
+            if unknown:
+                errors.append(f"Unknown projects: {', '.join(unknown)}.")
+            if unlocated:
+                errors.append(f"Projects without coordinates: {', '.join(unlocated)}.")
+            return Response({"uuids": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        start = query.validated_data.get("start")
+        result = plan_route(
+            [float(coordinates[u][0]) for u in uuids],
+            [float(coordinates[u][1]) for u in uuids],
+            start=(start["latitude"], start["longitude"]) if start else None,
+        )
+        return Response({
+            "order": [str(uuids[stop]) for stop in result["order"]],
+            "total_distance_km": round(result["distance_km"], 3),
+            "converged": result["converged"],
+        })
+
+
+async def project_events(request):
+    """
+    Server-Sent Events stream of project changes (GET /api/projects/events/).
+
+    Sends ``created``, ``updated``, ``geocoded`` and ``deleted`` events whose
+    id is the change sequence number and whose data holds the project UUID and
+    its current serialized state (null for deletions). Must be served by the
+    ASGI application.
+
+    Query parameters:
+        status (str): Comma-separated statuses to receive events for
+        bbox (str): ``west,south,east,north`` area to receive events for
+        last_event_id (int): Resume position, if no Last-Event-ID header is sent
+
+    Returns:
+        StreamingHttpResponse: A ``text/event-stream`` response
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"detail": "The event stream is only available from the ASGI application."},
+            status=status.HTTP_501_NOT_IMPLEMENTED,
+        )
+
+    params = request.GET.dict()
+    if request.headers.get("Last-Event-ID"):
+        params["last_event_id"] = request.headers["Last-Event-ID"]
+    filters = ProjectEventFilterSerializer(data=params)
+    if not filters.is_valid():
+        return JsonResponse(filters.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    response = StreamingHttpResponse(
+        stream_events(
+            filters.validated_data.get("last_event_id"),
+            filters.validated_data.get("status"),
+            filters.validated_data.get("bbox"),
+        ),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response